@@ -5,22 +5,162 @@ d = { 'settings': { 'branch': 'main',
                 'doc_host': 'https://fewsats.github.io',
                 'git_url': 'https://github.com/fewsats/sherlock-python',
                 'lib_path': 'sherlock'},
-  'syms': { 'sherlock.auth': { 'sherlock.auth._get_challenge': ('auth.html#_get_challenge', 'sherlock/auth.py'),
+  'syms': { 'sherlock.aio': { 'sherlock.aio.AsyncSherlock': ('aio.html#asyncsherlock', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.__aenter__': ('aio.html#asyncsherlock.__aenter__', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.__aexit__': ('aio.html#asyncsherlock.__aexit__', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.__init__': ('aio.html#asyncsherlock.__init__', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.__str__': ('aio.html#asyncsherlock.__str__', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._claim_account': ('aio.html#asyncsherlock._claim_account', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._contact': ('aio.html#asyncsherlock._contact', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._create_dns_record': ( 'aio.html#asyncsherlock._create_dns_record',
+                                                                                 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._delete_dns_record': ( 'aio.html#asyncsherlock._delete_dns_record',
+                                                                                 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._dns_records': ('aio.html#asyncsherlock._dns_records', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._domains': ('aio.html#asyncsherlock._domains', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._get_contact_information': ( 'aio.html#asyncsherlock._get_contact_information',
+                                                                                       'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._get_purchase_offers': ( 'aio.html#asyncsherlock._get_purchase_offers',
+                                                                                   'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._get_x402_purchase_offers': ( 'aio.html#asyncsherlock._get_x402_purchase_offers',
+                                                                                        'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._me': ('aio.html#asyncsherlock._me', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._offers_task': ('aio.html#asyncsherlock._offers_task', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._prefetch_offers': ('aio.html#asyncsherlock._prefetch_offers', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._prefetched_offers': ( 'aio.html#asyncsherlock._prefetched_offers',
+                                                                                 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._purchase_one': ('aio.html#asyncsherlock._purchase_one', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._purchase_x402': ('aio.html#asyncsherlock._purchase_x402', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._read': ('aio.html#asyncsherlock._read', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._request_payment_details': ( 'aio.html#asyncsherlock._request_payment_details',
+                                                                                       'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._revalidate': ('aio.html#asyncsherlock._revalidate', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._search': ('aio.html#asyncsherlock._search', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._set_contact_information': ( 'aio.html#asyncsherlock._set_contact_information',
+                                                                                       'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._sid': ('aio.html#asyncsherlock._sid', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._update_dns_record': ( 'aio.html#asyncsherlock._update_dns_record',
+                                                                                 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock._update_nameservers': ( 'aio.html#asyncsherlock._update_nameservers',
+                                                                                  'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.aclose': ('aio.html#asyncsherlock.aclose', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.as_tools': ('aio.html#asyncsherlock.as_tools', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.atok': ('aio.html#asyncsherlock.atok', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.authenticate': ('aio.html#asyncsherlock.authenticate', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.claim_account': ('aio.html#asyncsherlock.claim_account', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.create_dns': ('aio.html#asyncsherlock.create_dns', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.delete_dns': ('aio.html#asyncsherlock.delete_dns', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.dns_records': ('aio.html#asyncsherlock.dns_records', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.domains': ('aio.html#asyncsherlock.domains', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.find_domains': ('aio.html#asyncsherlock.find_domains', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.get_contact_information': ( 'aio.html#asyncsherlock.get_contact_information',
+                                                                                      'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.get_payment_details': ( 'aio.html#asyncsherlock.get_payment_details',
+                                                                                  'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.get_purchase_offers': ( 'aio.html#asyncsherlock.get_purchase_offers',
+                                                                                  'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.get_x402_purchase_offers': ( 'aio.html#asyncsherlock.get_x402_purchase_offers',
+                                                                                       'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.iter_domains': ('aio.html#asyncsherlock.iter_domains', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.me': ('aio.html#asyncsherlock.me', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.purchase_many': ('aio.html#asyncsherlock.purchase_many', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.purchase_x402': ('aio.html#asyncsherlock.purchase_x402', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.request_payment_details': ( 'aio.html#asyncsherlock.request_payment_details',
+                                                                                      'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.rtok': ('aio.html#asyncsherlock.rtok', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.search': ('aio.html#asyncsherlock.search', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.search_many': ('aio.html#asyncsherlock.search_many', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.set_contact_information': ( 'aio.html#asyncsherlock.set_contact_information',
+                                                                                      'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.update_dns': ('aio.html#asyncsherlock.update_dns', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.update_nameservers': ( 'aio.html#asyncsherlock.update_nameservers',
+                                                                                 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.wait_for_domain': ('aio.html#asyncsherlock.wait_for_domain', 'sherlock/aio.py'),
+                              'sherlock.aio.AsyncSherlock.wait_for_domains': ('aio.html#asyncsherlock.wait_for_domains', 'sherlock/aio.py'),
+                              'sherlock.aio._retrieve': ('aio.html#_retrieve', 'sherlock/aio.py'),
+                              'sherlock.aio._tool': ('aio.html#_tool', 'sherlock/aio.py')},
+            'sherlock.auth': { 'sherlock.auth.SherlockAuth': ('auth.html#sherlockauth', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth.__del__': ('auth.html#sherlockauth.__del__', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth.__init__': ('auth.html#sherlockauth.__init__', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth._abackground': ('auth.html#sherlockauth._abackground', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth._async_lock': ('auth.html#sherlockauth._async_lock', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth._background': ('auth.html#sherlockauth._background', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth._refreshable': ('auth.html#sherlockauth._refreshable', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth._schedule': ('auth.html#sherlockauth._schedule', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth._set': ('auth.html#sherlockauth._set', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth._stale': ('auth.html#sherlockauth._stale', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth._use': ('auth.html#sherlockauth._use', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth.alogin': ('auth.html#sherlockauth.alogin', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth.arenew': ('auth.html#sherlockauth.arenew', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth.async_auth_flow': ('auth.html#sherlockauth.async_auth_flow', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth.atoken': ('auth.html#sherlockauth.atoken', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth.cancel': ('auth.html#sherlockauth.cancel', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth.login': ('auth.html#sherlockauth.login', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth.renew': ('auth.html#sherlockauth.renew', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth.sync_auth_flow': ('auth.html#sherlockauth.sync_auth_flow', 'sherlock/auth.py'),
+                               'sherlock.auth.SherlockAuth.token': ('auth.html#sherlockauth.token', 'sherlock/auth.py'),
+                               'sherlock.auth._dead': ('auth.html#_dead', 'sherlock/auth.py'),
+                               'sherlock.auth._exp': ('auth.html#_exp', 'sherlock/auth.py'),
+                               'sherlock.auth._get_challenge': ('auth.html#_get_challenge', 'sherlock/auth.py'),
                                'sherlock.auth._handle_response': ('auth.html#_handle_response', 'sherlock/auth.py'),
+                               'sherlock.auth._renew_later': ('auth.html#_renew_later', 'sherlock/auth.py'),
                                'sherlock.auth._sign_challenge': ('auth.html#_sign_challenge', 'sherlock/auth.py'),
                                'sherlock.auth._submit_challenge': ('auth.html#_submit_challenge', 'sherlock/auth.py'),
+                               'sherlock.auth.aauthenticate': ('auth.html#aauthenticate', 'sherlock/auth.py'),
+                               'sherlock.auth.alink_account_to_email': ('auth.html#alink_account_to_email', 'sherlock/auth.py'),
+                               'sherlock.auth.arefresh': ('auth.html#arefresh', 'sherlock/auth.py'),
                                'sherlock.auth.authenticate': ('auth.html#authenticate', 'sherlock/auth.py'),
-                               'sherlock.auth.link_account_to_email': ('auth.html#link_account_to_email', 'sherlock/auth.py')},
+                               'sherlock.auth.link_account_to_email': ('auth.html#link_account_to_email', 'sherlock/auth.py'),
+                               'sherlock.auth.refresh': ('auth.html#refresh', 'sherlock/auth.py')},
+            'sherlock.cache': { 'sherlock.cache.ReadCache': ('cache.html#readcache', 'sherlock/cache.py'),
+                                'sherlock.cache.ReadCache.__init__': ('cache.html#readcache.__init__', 'sherlock/cache.py'),
+                                'sherlock.cache.ReadCache._set': ('cache.html#readcache._set', 'sherlock/cache.py'),
+                                'sherlock.cache.ReadCache.headers': ('cache.html#readcache.headers', 'sherlock/cache.py'),
+                                'sherlock.cache.ReadCache.invalidate': ('cache.html#readcache.invalidate', 'sherlock/cache.py'),
+                                'sherlock.cache.ReadCache.lookup': ('cache.html#readcache.lookup', 'sherlock/cache.py'),
+                                'sherlock.cache.ReadCache.refresh': ('cache.html#readcache.refresh', 'sherlock/cache.py'),
+                                'sherlock.cache.ReadCache.refreshed': ('cache.html#readcache.refreshed', 'sherlock/cache.py'),
+                                'sherlock.cache.ReadCache.revalidated': ('cache.html#readcache.revalidated', 'sherlock/cache.py'),
+                                'sherlock.cache.ReadCache.store': ('cache.html#readcache.store', 'sherlock/cache.py'),
+                                'sherlock.cache.ReadCache.version': ('cache.html#readcache.version', 'sherlock/cache.py'),
+                                'sherlock.cache.SearchIds': ('cache.html#searchids', 'sherlock/cache.py'),
+                                'sherlock.cache.SearchIds.__init__': ('cache.html#searchids.__init__', 'sherlock/cache.py'),
+                                'sherlock.cache.SearchIds.add': ('cache.html#searchids.add', 'sherlock/cache.py'),
+                                'sherlock.cache.SearchIds.sid': ('cache.html#searchids.sid', 'sherlock/cache.py'),
+                                'sherlock.cache.TTLCache': ('cache.html#ttlcache', 'sherlock/cache.py'),
+                                'sherlock.cache.TTLCache.__init__': ('cache.html#ttlcache.__init__', 'sherlock/cache.py'),
+                                'sherlock.cache.TTLCache.__len__': ('cache.html#ttlcache.__len__', 'sherlock/cache.py'),
+                                'sherlock.cache.TTLCache.__repr__': ('cache.html#ttlcache.__repr__', 'sherlock/cache.py'),
+                                'sherlock.cache.TTLCache._drop': ('cache.html#ttlcache._drop', 'sherlock/cache.py'),
+                                'sherlock.cache.TTLCache.clear': ('cache.html#ttlcache.clear', 'sherlock/cache.py'),
+                                'sherlock.cache.TTLCache.get': ('cache.html#ttlcache.get', 'sherlock/cache.py'),
+                                'sherlock.cache.TTLCache.pop': ('cache.html#ttlcache.pop', 'sherlock/cache.py'),
+                                'sherlock.cache.TTLCache.set': ('cache.html#ttlcache.set', 'sherlock/cache.py')},
             'sherlock.config': { 'sherlock.config.SherlockConfig': ('config.html#sherlockconfig', 'sherlock/config.py'),
                                  'sherlock.config._cfg_path': ('config.html#_cfg_path', 'sherlock/config.py'),
+                                 'sherlock.config._stamp': ('config.html#_stamp', 'sherlock/config.py'),
+                                 'sherlock.config._tokens_key': ('config.html#_tokens_key', 'sherlock/config.py'),
+                                 'sherlock.config._tokens_path': ('config.html#_tokens_path', 'sherlock/config.py'),
+                                 'sherlock.config._xdg_config_home': ('config.html#_xdg_config_home', 'sherlock/config.py'),
                                  'sherlock.config.get_cfg': ('config.html#get_cfg', 'sherlock/config.py'),
-                                 'sherlock.config.save_cfg': ('config.html#save_cfg', 'sherlock/config.py')},
+                                 'sherlock.config.load_tokens': ('config.html#load_tokens', 'sherlock/config.py'),
+                                 'sherlock.config.save_cfg': ('config.html#save_cfg', 'sherlock/config.py'),
+                                 'sherlock.config.save_tokens': ('config.html#save_tokens', 'sherlock/config.py')},
             'sherlock.core': { 'sherlock.core.Contact': ('core.html#contact', 'sherlock/core.py'),
                                'sherlock.core.Contact.__init__': ('core.html#contact.__init__', 'sherlock/core.py'),
                                'sherlock.core.Contact.asdict': ('core.html#contact.asdict', 'sherlock/core.py'),
                                'sherlock.core.Contact.from_dict': ('core.html#contact.from_dict', 'sherlock/core.py'),
                                'sherlock.core.Contact.is_valid': ('core.html#contact.is_valid', 'sherlock/core.py'),
+                               'sherlock.core.InvalidQuery': ('core.html#invalidquery', 'sherlock/core.py'),
+                               'sherlock.core.InvalidQuery.__init__': ('core.html#invalidquery.__init__', 'sherlock/core.py'),
+                               'sherlock.core.InvalidQuery.asdict': ('core.html#invalidquery.asdict', 'sherlock/core.py'),
+                               'sherlock.core.SearchCache': ('core.html#searchcache', 'sherlock/core.py'),
+                               'sherlock.core.SearchCache.__init__': ('core.html#searchcache.__init__', 'sherlock/core.py'),
+                               'sherlock.core.SearchCache.lookup': ('core.html#searchcache.lookup', 'sherlock/core.py'),
+                               'sherlock.core.SearchCache.store': ('core.html#searchcache.store', 'sherlock/core.py'),
                                'sherlock.core.Sherlock': ('core.html#sherlock', 'sherlock/core.py'),
+                               'sherlock.core.Sherlock.__enter__': ('core.html#sherlock.__enter__', 'sherlock/core.py'),
+                               'sherlock.core.Sherlock.__exit__': ('core.html#sherlock.__exit__', 'sherlock/core.py'),
                                'sherlock.core.Sherlock.__init__': ('core.html#sherlock.__init__', 'sherlock/core.py'),
                                'sherlock.core.Sherlock.__str__': ('core.html#sherlock.__str__', 'sherlock/core.py'),
                                'sherlock.core.Sherlock._authenticate': ('core.html#sherlock._authenticate', 'sherlock/core.py'),
@@ -36,40 +176,264 @@ d = { 'settings': { 'branch': 'main',
                                'sherlock.core.Sherlock._get_x402_purchase_offers': ( 'core.html#sherlock._get_x402_purchase_offers',
                                                                                      'sherlock/core.py'),
                                'sherlock.core.Sherlock._me': ('core.html#sherlock._me', 'sherlock/core.py'),
+                               'sherlock.core.Sherlock._offers_task': ('core.html#sherlock._offers_task', 'sherlock/core.py'),
+                               'sherlock.core.Sherlock._prefetch_offers': ('core.html#sherlock._prefetch_offers', 'sherlock/core.py'),
+                               'sherlock.core.Sherlock._prefetched_offers': ('core.html#sherlock._prefetched_offers', 'sherlock/core.py'),
+                               'sherlock.core.Sherlock._purchase_one': ('core.html#sherlock._purchase_one', 'sherlock/core.py'),
                                'sherlock.core.Sherlock._purchase_x402': ('core.html#sherlock._purchase_x402', 'sherlock/core.py'),
+                               'sherlock.core.Sherlock._read': ('core.html#sherlock._read', 'sherlock/core.py'),
                                'sherlock.core.Sherlock._request_payment_details': ( 'core.html#sherlock._request_payment_details',
                                                                                     'sherlock/core.py'),
+                               'sherlock.core.Sherlock._revalidate': ('core.html#sherlock._revalidate', 'sherlock/core.py'),
                                'sherlock.core.Sherlock._search': ('core.html#sherlock._search', 'sherlock/core.py'),
                                'sherlock.core.Sherlock._set_contact_information': ( 'core.html#sherlock._set_contact_information',
                                                                                     'sherlock/core.py'),
+                               'sherlock.core.Sherlock._sid': ('core.html#sherlock._sid', 'sherlock/core.py'),
                                'sherlock.core.Sherlock._update_dns_record': ('core.html#sherlock._update_dns_record', 'sherlock/core.py'),
                                'sherlock.core.Sherlock._update_nameservers': ('core.html#sherlock._update_nameservers', 'sherlock/core.py'),
                                'sherlock.core.Sherlock.as_cli': ('core.html#sherlock.as_cli', 'sherlock/core.py'),
                                'sherlock.core.Sherlock.as_tools': ('core.html#sherlock.as_tools', 'sherlock/core.py'),
+                               'sherlock.core.Sherlock.atok': ('core.html#sherlock.atok', 'sherlock/core.py'),
                                'sherlock.core.Sherlock.claim_account': ('core.html#sherlock.claim_account', 'sherlock/core.py'),
+                               'sherlock.core.Sherlock.close': ('core.html#sherlock.close', 'sherlock/core.py'),
                                'sherlock.core.Sherlock.create_dns': ('core.html#sherlock.create_dns', 'sherlock/core.py'),
                                'sherlock.core.Sherlock.delete_dns': ('core.html#sherlock.delete_dns', 'sherlock/core.py'),
                                'sherlock.core.Sherlock.dns_records': ('core.html#sherlock.dns_records', 'sherlock/core.py'),
                                'sherlock.core.Sherlock.domains': ('core.html#sherlock.domains', 'sherlock/core.py'),
+                               'sherlock.core.Sherlock.find_domains': ('core.html#sherlock.find_domains', 'sherlock/core.py'),
                                'sherlock.core.Sherlock.get_contact_information': ( 'core.html#sherlock.get_contact_information',
                                                                                    'sherlock/core.py'),
                                'sherlock.core.Sherlock.get_payment_details': ('core.html#sherlock.get_payment_details', 'sherlock/core.py'),
                                'sherlock.core.Sherlock.get_purchase_offers': ('core.html#sherlock.get_purchase_offers', 'sherlock/core.py'),
                                'sherlock.core.Sherlock.get_x402_purchase_offers': ( 'core.html#sherlock.get_x402_purchase_offers',
                                                                                     'sherlock/core.py'),
+                               'sherlock.core.Sherlock.iter_domains': ('core.html#sherlock.iter_domains', 'sherlock/core.py'),
                                'sherlock.core.Sherlock.me': ('core.html#sherlock.me', 'sherlock/core.py'),
+                               'sherlock.core.Sherlock.purchase_many': ('core.html#sherlock.purchase_many', 'sherlock/core.py'),
                                'sherlock.core.Sherlock.purchase_x402': ('core.html#sherlock.purchase_x402', 'sherlock/core.py'),
                                'sherlock.core.Sherlock.request_payment_details': ( 'core.html#sherlock.request_payment_details',
                                                                                    'sherlock/core.py'),
+                               'sherlock.core.Sherlock.rtok': ('core.html#sherlock.rtok', 'sherlock/core.py'),
                                'sherlock.core.Sherlock.search': ('core.html#sherlock.search', 'sherlock/core.py'),
+                               'sherlock.core.Sherlock.search_many': ('core.html#sherlock.search_many', 'sherlock/core.py'),
                                'sherlock.core.Sherlock.set_contact_information': ( 'core.html#sherlock.set_contact_information',
                                                                                    'sherlock/core.py'),
                                'sherlock.core.Sherlock.update_dns': ('core.html#sherlock.update_dns', 'sherlock/core.py'),
                                'sherlock.core.Sherlock.update_nameservers': ('core.html#sherlock.update_nameservers', 'sherlock/core.py'),
+                               'sherlock.core.Sherlock.wait_for_domain': ('core.html#sherlock.wait_for_domain', 'sherlock/core.py'),
+                               'sherlock.core.Sherlock.wait_for_domains': ('core.html#sherlock.wait_for_domains', 'sherlock/core.py'),
+                               'sherlock.core._Checkpoint': ('core.html#_checkpoint', 'sherlock/core.py'),
+                               'sherlock.core._Checkpoint.__enter__': ('core.html#_checkpoint.__enter__', 'sherlock/core.py'),
+                               'sherlock.core._Checkpoint.__exit__': ('core.html#_checkpoint.__exit__', 'sherlock/core.py'),
+                               'sherlock.core._Checkpoint.__init__': ('core.html#_checkpoint.__init__', 'sherlock/core.py'),
+                               'sherlock.core._Checkpoint._write': ('core.html#_checkpoint._write', 'sherlock/core.py'),
+                               'sherlock.core._Checkpoint.add': ('core.html#_checkpoint.add', 'sherlock/core.py'),
+                               'sherlock.core._Checkpoint.close': ('core.html#_checkpoint.close', 'sherlock/core.py'),
+                               'sherlock.core._Checkpoint.get': ('core.html#_checkpoint.get', 'sherlock/core.py'),
+                               'sherlock.core._Checkpoint.key': ('core.html#_checkpoint.key', 'sherlock/core.py'),
+                               'sherlock.core._DomainWaiter': ('core.html#_domainwaiter', 'sherlock/core.py'),
+                               'sherlock.core._DomainWaiter.__init__': ('core.html#_domainwaiter.__init__', 'sherlock/core.py'),
+                               'sherlock.core._DomainWaiter.update': ('core.html#_domainwaiter.update', 'sherlock/core.py'),
+                               'sherlock.core._DomainWaiter.wait': ('core.html#_domainwaiter.wait', 'sherlock/core.py'),
+                               'sherlock.core._JSONItems': ('core.html#_jsonitems', 'sherlock/core.py'),
+                               'sherlock.core._JSONItems.__init__': ('core.html#_jsonitems.__init__', 'sherlock/core.py'),
+                               'sherlock.core._JSONItems.feed': ('core.html#_jsonitems.feed', 'sherlock/core.py'),
+                               'sherlock.core._cached_contact': ('core.html#_cached_contact', 'sherlock/core.py'),
+                               'sherlock.core._cached_response': ('core.html#_cached_response', 'sherlock/core.py'),
+                               'sherlock.core._cli_parser': ('core.html#_cli_parser', 'sherlock/core.py'),
+                               'sherlock.core._contact_payload': ('core.html#_contact_payload', 'sherlock/core.py'),
+                               'sherlock.core._cursor': ('core.html#_cursor', 'sherlock/core.py'),
+                               'sherlock.core._discard_prefetch': ('core.html#_discard_prefetch', 'sherlock/core.py'),
+                               'sherlock.core._dns_endpoint': ('core.html#_dns_endpoint', 'sherlock/core.py'),
+                               'sherlock.core._dns_payload': ('core.html#_dns_payload', 'sherlock/core.py'),
+                               'sherlock.core._first_available': ('core.html#_first_available', 'sherlock/core.py'),
+                               'sherlock.core._first_offer': ('core.html#_first_offer', 'sherlock/core.py'),
                                'sherlock.core._get_offers_payload': ('core.html#_get_offers_payload', 'sherlock/core.py'),
                                'sherlock.core._handle_response': ('core.html#_handle_response', 'sherlock/core.py'),
+                               'sherlock.core._invalidate': ('core.html#_invalidate', 'sherlock/core.py'),
+                               'sherlock.core._label': ('core.html#_label', 'sherlock/core.py'),
+                               'sherlock.core._limit': ('core.html#_limit', 'sherlock/core.py'),
+                               'sherlock.core._load_checkpoint': ('core.html#_load_checkpoint', 'sherlock/core.py'),
+                               'sherlock.core._load_keys': ('core.html#_load_keys', 'sherlock/core.py'),
+                               'sherlock.core._matches': ('core.html#_matches', 'sherlock/core.py'),
                                'sherlock.core._mk_headers': ('core.html#_mk_headers', 'sherlock/core.py'),
-                               'sherlock.core.main': ('core.html#main', 'sherlock/core.py')},
+                               'sherlock.core._nameservers_endpoint': ('core.html#_nameservers_endpoint', 'sherlock/core.py'),
+                               'sherlock.core._page': ('core.html#_page', 'sherlock/core.py'),
+                               'sherlock.core._payment_payload': ('core.html#_payment_payload', 'sherlock/core.py'),
+                               'sherlock.core._prefetch_result': ('core.html#_prefetch_result', 'sherlock/core.py'),
+                               'sherlock.core._purchase_items': ('core.html#_purchase_items', 'sherlock/core.py'),
+                               'sherlock.core._purchase_result': ('core.html#_purchase_result', 'sherlock/core.py'),
+                               'sherlock.core._query_key': ('core.html#_query_key', 'sherlock/core.py'),
+                               'sherlock.core._read_key': ('core.html#_read_key', 'sherlock/core.py'),
+                               'sherlock.core._search_result': ('core.html#_search_result', 'sherlock/core.py'),
+                               'sherlock.core._store_contact': ('core.html#_store_contact', 'sherlock/core.py'),
+                               'sherlock.core._take_prefetch': ('core.html#_take_prefetch', 'sherlock/core.py'),
+                               'sherlock.core._unique': ('core.html#_unique', 'sherlock/core.py'),
+                               'sherlock.core._valid_contact': ('core.html#_valid_contact', 'sherlock/core.py'),
+                               'sherlock.core._x402_headers': ('core.html#_x402_headers', 'sherlock/core.py'),
+                               'sherlock.core.main': ('core.html#main', 'sherlock/core.py'),
+                               'sherlock.core.normalize_query': ('core.html#normalize_query', 'sherlock/core.py')},
             'sherlock.crypto': { 'sherlock.crypto.from_pk_hex': ('crypto.html#from_pk_hex', 'sherlock/crypto.py'),
                                  'sherlock.crypto.generate_keys': ('crypto.html#generate_keys', 'sherlock/crypto.py'),
-                                 'sherlock.crypto.priv_key_hex': ('crypto.html#priv_key_hex', 'sherlock/crypto.py')}}}
+                                 'sherlock.crypto.priv_key_hex': ('crypto.html#priv_key_hex', 'sherlock/crypto.py')},
+            'sherlock.history': { 'sherlock.history.SearchHistory': ('history.html#searchhistory', 'sherlock/history.py'),
+                                  'sherlock.history.SearchHistory.__init__': ('history.html#searchhistory.__init__', 'sherlock/history.py'),
+                                  'sherlock.history.SearchHistory.__len__': ('history.html#searchhistory.__len__', 'sherlock/history.py'),
+                                  'sherlock.history.SearchHistory.__repr__': ('history.html#searchhistory.__repr__', 'sherlock/history.py'),
+                                  'sherlock.history.SearchHistory._all': ('history.html#searchhistory._all', 'sherlock/history.py'),
+                                  'sherlock.history.SearchHistory.close': ('history.html#searchhistory.close', 'sherlock/history.py'),
+                                  'sherlock.history.SearchHistory.history': ('history.html#searchhistory.history', 'sherlock/history.py'),
+                                  'sherlock.history.SearchHistory.last_seen': ( 'history.html#searchhistory.last_seen',
+                                                                                'sherlock/history.py'),
+                                  'sherlock.history.SearchHistory.lookup': ('history.html#searchhistory.lookup', 'sherlock/history.py'),
+                                  'sherlock.history.SearchHistory.record': ('history.html#searchhistory.record', 'sherlock/history.py'),
+                                  'sherlock.history.SearchHistory.record_many': ( 'history.html#searchhistory.record_many',
+                                                                                  'sherlock/history.py'),
+                                  'sherlock.history.SearchHistory.tld': ('history.html#searchhistory.tld', 'sherlock/history.py'),
+                                  'sherlock.history._domain_rows': ('history.html#_domain_rows', 'sherlock/history.py'),
+                                  'sherlock.history._history_path': ('history.html#_history_path', 'sherlock/history.py'),
+                                  'sherlock.history._row': ('history.html#_row', 'sherlock/history.py')},
+            'sherlock.inventory': { 'sherlock.inventory.DomainInventory': ('inventory.html#domaininventory', 'sherlock/inventory.py'),
+                                    'sherlock.inventory.DomainInventory.__contains__': ( 'inventory.html#domaininventory.__contains__',
+                                                                                         'sherlock/inventory.py'),
+                                    'sherlock.inventory.DomainInventory.__init__': ( 'inventory.html#domaininventory.__init__',
+                                                                                     'sherlock/inventory.py'),
+                                    'sherlock.inventory.DomainInventory.__iter__': ( 'inventory.html#domaininventory.__iter__',
+                                                                                     'sherlock/inventory.py'),
+                                    'sherlock.inventory.DomainInventory.__len__': ( 'inventory.html#domaininventory.__len__',
+                                                                                    'sherlock/inventory.py'),
+                                    'sherlock.inventory.DomainInventory.__repr__': ( 'inventory.html#domaininventory.__repr__',
+                                                                                     'sherlock/inventory.py'),
+                                    'sherlock.inventory.DomainInventory._add': ( 'inventory.html#domaininventory._add',
+                                                                                 'sherlock/inventory.py'),
+                                    'sherlock.inventory.DomainInventory._drop': ( 'inventory.html#domaininventory._drop',
+                                                                                  'sherlock/inventory.py'),
+                                    'sherlock.inventory.DomainInventory.expired': ( 'inventory.html#domaininventory.expired',
+                                                                                    'sherlock/inventory.py'),
+                                    'sherlock.inventory.DomainInventory.expiring': ( 'inventory.html#domaininventory.expiring',
+                                                                                     'sherlock/inventory.py'),
+                                    'sherlock.inventory.DomainInventory.get': ( 'inventory.html#domaininventory.get',
+                                                                                'sherlock/inventory.py'),
+                                    'sherlock.inventory.DomainInventory.id_of': ( 'inventory.html#domaininventory.id_of',
+                                                                                  'sherlock/inventory.py'),
+                                    'sherlock.inventory.DomainInventory.sync': ( 'inventory.html#domaininventory.sync',
+                                                                                 'sherlock/inventory.py'),
+                                    'sherlock.inventory.DomainInventory.using': ( 'inventory.html#domaininventory.using',
+                                                                                  'sherlock/inventory.py'),
+                                    'sherlock.inventory._ns': ('inventory.html#_ns', 'sherlock/inventory.py'),
+                                    'sherlock.inventory._nss': ('inventory.html#_nss', 'sherlock/inventory.py'),
+                                    'sherlock.inventory._ts': ('inventory.html#_ts', 'sherlock/inventory.py')},
+            'sherlock.mcp': { 'sherlock.mcp._Workers': ('mcp.html#_workers', 'sherlock/mcp.py'),
+                              'sherlock.mcp._Workers.__init__': ('mcp.html#_workers.__init__', 'sherlock/mcp.py'),
+                              'sherlock.mcp._Workers.lifespan': ('mcp.html#_workers.lifespan', 'sherlock/mcp.py'),
+                              'sherlock.mcp._Workers.threaded': ('mcp.html#_workers.threaded', 'sherlock/mcp.py'),
+                              'sherlock.mcp.main': ('mcp.html#main', 'sherlock/mcp.py'),
+                              'sherlock.mcp.mk_mcp': ('mcp.html#mk_mcp', 'sherlock/mcp.py')},
+            'sherlock.models': { 'sherlock.models.DnsRecord': ('models.html#dnsrecord', 'sherlock/models.py'),
+                                 'sherlock.models.DnsRecords': ('models.html#dnsrecords', 'sherlock/models.py'),
+                                 'sherlock.models.Domain': ('models.html#domain', 'sherlock/models.py'),
+                                 'sherlock.models.DomainOffer': ('models.html#domainoffer', 'sherlock/models.py'),
+                                 'sherlock.models.Model': ('models.html#model', 'sherlock/models.py'),
+                                 'sherlock.models.Model.__eq__': ('models.html#model.__eq__', 'sherlock/models.py'),
+                                 'sherlock.models.Model.__getitem__': ('models.html#model.__getitem__', 'sherlock/models.py'),
+                                 'sherlock.models.Model.__init__': ('models.html#model.__init__', 'sherlock/models.py'),
+                                 'sherlock.models.Model.__init_subclass__': ('models.html#model.__init_subclass__', 'sherlock/models.py'),
+                                 'sherlock.models.Model.__repr__': ('models.html#model.__repr__', 'sherlock/models.py'),
+                                 'sherlock.models.Model.asdict': ('models.html#model.asdict', 'sherlock/models.py'),
+                                 'sherlock.models.Model.from_list': ('models.html#model.from_list', 'sherlock/models.py'),
+                                 'sherlock.models.Model.get': ('models.html#model.get', 'sherlock/models.py'),
+                                 'sherlock.models.PurchaseOffer': ('models.html#purchaseoffer', 'sherlock/models.py'),
+                                 'sherlock.models.PurchaseOffers': ('models.html#purchaseoffers', 'sherlock/models.py'),
+                                 'sherlock.models.SearchResult': ('models.html#searchresult', 'sherlock/models.py'),
+                                 'sherlock.models._Lazy': ('models.html#_lazy', 'sherlock/models.py'),
+                                 'sherlock.models._Lazy.__get__': ('models.html#_lazy.__get__', 'sherlock/models.py'),
+                                 'sherlock.models._Lazy.__init__': ('models.html#_lazy.__init__', 'sherlock/models.py'),
+                                 'sherlock.models._Lazy.__set_name__': ('models.html#_lazy.__set_name__', 'sherlock/models.py'),
+                                 'sherlock.models._asdict': ('models.html#_asdict', 'sherlock/models.py')},
+            'sherlock.prices': { 'sherlock.prices.PriceTable': ('prices.html#pricetable', 'sherlock/prices.py'),
+                                 'sherlock.prices.PriceTable.__init__': ('prices.html#pricetable.__init__', 'sherlock/prices.py'),
+                                 'sherlock.prices.PriceTable.__len__': ('prices.html#pricetable.__len__', 'sherlock/prices.py'),
+                                 'sherlock.prices.PriceTable.__repr__': ('prices.html#pricetable.__repr__', 'sherlock/prices.py'),
+                                 'sherlock.prices.PriceTable._take': ('prices.html#pricetable._take', 'sherlock/prices.py'),
+                                 'sherlock.prices.PriceTable.by_tld': ('prices.html#pricetable.by_tld', 'sherlock/prices.py'),
+                                 'sherlock.prices.PriceTable.cheapest': ('prices.html#pricetable.cheapest', 'sherlock/prices.py'),
+                                 'sherlock.prices.PriceTable.from_results': ('prices.html#pricetable.from_results', 'sherlock/prices.py'),
+                                 'sherlock.prices.PriceTable.rows': ('prices.html#pricetable.rows', 'sherlock/prices.py'),
+                                 'sherlock.prices.PriceTable.where': ('prices.html#pricetable.where', 'sherlock/prices.py'),
+                                 'sherlock.prices._codes': ('prices.html#_codes', 'sherlock/prices.py'),
+                                 'sherlock.prices._col': ('prices.html#_col', 'sherlock/prices.py'),
+                                 'sherlock.prices._list': ('prices.html#_list', 'sherlock/prices.py')},
+            'sherlock.transport': { 'sherlock.transport.AsyncRateLimitTransport': ( 'transport.html#asyncratelimittransport',
+                                                                                    'sherlock/transport.py'),
+                                    'sherlock.transport.AsyncRateLimitTransport.__init__': ( 'transport.html#asyncratelimittransport.__init__',
+                                                                                             'sherlock/transport.py'),
+                                    'sherlock.transport.AsyncRateLimitTransport.aclose': ( 'transport.html#asyncratelimittransport.aclose',
+                                                                                           'sherlock/transport.py'),
+                                    'sherlock.transport.AsyncRateLimitTransport.handle_async_request': ( 'transport.html#asyncratelimittransport.handle_async_request',
+                                                                                                         'sherlock/transport.py'),
+                                    'sherlock.transport.AsyncRetryTransport': ( 'transport.html#asyncretrytransport',
+                                                                                'sherlock/transport.py'),
+                                    'sherlock.transport.AsyncRetryTransport.__init__': ( 'transport.html#asyncretrytransport.__init__',
+                                                                                         'sherlock/transport.py'),
+                                    'sherlock.transport.AsyncRetryTransport.aclose': ( 'transport.html#asyncretrytransport.aclose',
+                                                                                       'sherlock/transport.py'),
+                                    'sherlock.transport.AsyncRetryTransport.handle_async_request': ( 'transport.html#asyncretrytransport.handle_async_request',
+                                                                                                     'sherlock/transport.py'),
+                                    'sherlock.transport.FileTokenBucket': ('transport.html#filetokenbucket', 'sherlock/transport.py'),
+                                    'sherlock.transport.FileTokenBucket.__init__': ( 'transport.html#filetokenbucket.__init__',
+                                                                                     'sherlock/transport.py'),
+                                    'sherlock.transport.FileTokenBucket._update': ( 'transport.html#filetokenbucket._update',
+                                                                                    'sherlock/transport.py'),
+                                    'sherlock.transport.RateLimitTransport': ('transport.html#ratelimittransport', 'sherlock/transport.py'),
+                                    'sherlock.transport.RateLimitTransport.__init__': ( 'transport.html#ratelimittransport.__init__',
+                                                                                        'sherlock/transport.py'),
+                                    'sherlock.transport.RateLimitTransport.close': ( 'transport.html#ratelimittransport.close',
+                                                                                     'sherlock/transport.py'),
+                                    'sherlock.transport.RateLimitTransport.handle_request': ( 'transport.html#ratelimittransport.handle_request',
+                                                                                              'sherlock/transport.py'),
+                                    'sherlock.transport.RateLimiter': ('transport.html#ratelimiter', 'sherlock/transport.py'),
+                                    'sherlock.transport.RateLimiter.__init__': ( 'transport.html#ratelimiter.__init__',
+                                                                                 'sherlock/transport.py'),
+                                    'sherlock.transport.RateLimiter.acquire': ( 'transport.html#ratelimiter.acquire',
+                                                                                'sherlock/transport.py'),
+                                    'sherlock.transport.RateLimiter.update': ('transport.html#ratelimiter.update', 'sherlock/transport.py'),
+                                    'sherlock.transport.RetryBudget': ('transport.html#retrybudget', 'sherlock/transport.py'),
+                                    'sherlock.transport.RetryBudget.__init__': ( 'transport.html#retrybudget.__init__',
+                                                                                 'sherlock/transport.py'),
+                                    'sherlock.transport.RetryBudget._prune': ('transport.html#retrybudget._prune', 'sherlock/transport.py'),
+                                    'sherlock.transport.RetryBudget.request': ( 'transport.html#retrybudget.request',
+                                                                                'sherlock/transport.py'),
+                                    'sherlock.transport.RetryBudget.withdraw': ( 'transport.html#retrybudget.withdraw',
+                                                                                 'sherlock/transport.py'),
+                                    'sherlock.transport.RetryPolicy': ('transport.html#retrypolicy', 'sherlock/transport.py'),
+                                    'sherlock.transport.RetryPolicy.__init__': ( 'transport.html#retrypolicy.__init__',
+                                                                                 'sherlock/transport.py'),
+                                    'sherlock.transport.RetryPolicy.delay': ('transport.html#retrypolicy.delay', 'sherlock/transport.py'),
+                                    'sherlock.transport.RetryTransport': ('transport.html#retrytransport', 'sherlock/transport.py'),
+                                    'sherlock.transport.RetryTransport.__init__': ( 'transport.html#retrytransport.__init__',
+                                                                                    'sherlock/transport.py'),
+                                    'sherlock.transport.RetryTransport.close': ( 'transport.html#retrytransport.close',
+                                                                                 'sherlock/transport.py'),
+                                    'sherlock.transport.RetryTransport.handle_request': ( 'transport.html#retrytransport.handle_request',
+                                                                                          'sherlock/transport.py'),
+                                    'sherlock.transport.TokenBucket': ('transport.html#tokenbucket', 'sherlock/transport.py'),
+                                    'sherlock.transport.TokenBucket.__init__': ( 'transport.html#tokenbucket.__init__',
+                                                                                 'sherlock/transport.py'),
+                                    'sherlock.transport.TokenBucket._update': ( 'transport.html#tokenbucket._update',
+                                                                                'sherlock/transport.py'),
+                                    'sherlock.transport.TokenBucket.acquire': ( 'transport.html#tokenbucket.acquire',
+                                                                                'sherlock/transport.py'),
+                                    'sherlock.transport.TokenBucket.block': ('transport.html#tokenbucket.block', 'sherlock/transport.py'),
+                                    'sherlock.transport.TokenBucket.limit': ('transport.html#tokenbucket.limit', 'sherlock/transport.py'),
+                                    'sherlock.transport._endpoint': ('transport.html#_endpoint', 'sherlock/transport.py'),
+                                    'sherlock.transport._group': ('transport.html#_group', 'sherlock/transport.py'),
+                                    'sherlock.transport._header': ('transport.html#_header', 'sherlock/transport.py'),
+                                    'sherlock.transport._idempotent': ('transport.html#_idempotent', 'sherlock/transport.py'),
+                                    'sherlock.transport._limits': ('transport.html#_limits', 'sherlock/transport.py'),
+                                    'sherlock.transport._ratelimit': ('transport.html#_ratelimit', 'sherlock/transport.py'),
+                                    'sherlock.transport._retry_after': ('transport.html#_retry_after', 'sherlock/transport.py'),
+                                    'sherlock.transport._ssl_context': ('transport.html#_ssl_context', 'sherlock/transport.py'),
+                                    'sherlock.transport._unprocessed': ('transport.html#_unprocessed', 'sherlock/transport.py'),
+                                    'sherlock.transport.mk_async_client': ('transport.html#mk_async_client', 'sherlock/transport.py'),
+                                    'sherlock.transport.mk_client': ('transport.html#mk_client', 'sherlock/transport.py'),
+                                    'sherlock.transport.retry_stats': ('transport.html#retry_stats', 'sherlock/transport.py')}}}
@@ -0,0 +1,552 @@
+"""Asyncio Sherlock client, mirroring the sync API on top of `httpx.AsyncClient`."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/05_aio.ipynb.
+
+# %% auto #0
+__all__ = ['AsyncSherlock']
+
+# %% ../nbs/05_aio.ipynb #013a8a24
+import asyncio, time
+import httpx
+from collections import Counter
+from itertools import islice
+from fastcore.basics import first, patch
+from fastcore.foundation import L
+
+from .auth import SherlockAuth, alink_account_to_email
+from .cache import SearchIds, ReadCache
+from .config import _tokens_path
+from .core import *
+from .core import (_handle_response, _load_keys, _mk_headers, _contact_payload, _valid_contact, _store_contact, _cached_contact,
+    _get_offers_payload, _payment_payload, _first_offer, _x402_headers, _nameservers_endpoint, _dns_endpoint, _dns_payload,
+    _unique, _search_result, _query_key, _matches, _first_available, _discard_prefetch, _take_prefetch, _prefetch_result,
+    _Checkpoint, _purchase_result, _purchase_items, _DomainWaiter,
+    _cached_response, _read_key, _invalidate, _JSONItems, _cursor, _limit, _page)
+from .transport import mk_async_client
+
+# %% ../nbs/05_aio.ipynb #e92bd55e
+class AsyncSherlock:
+    "Asyncio Sherlock client class to interact with the Sherlock API."
+    def __init__(self,
+                 priv: str = '', # private key
+                 client: httpx.AsyncClient = None, # http client shared by all requests, defaults to `mk_async_client()`
+                 cache: bool = True, # cache the tokens on disk so the next instances skip the login
+                 search_cache: SearchCache = None, # cache of the search results, off by default
+                 history: 'SearchHistory' = None, # local store recording every search, off by default
+                 read_cache: ReadCache = None, # cache of the domain list and DNS records, off by default
+                 prefetch: bool = False): # prefetch the purchase offers of the first domain found by each search
+        self.pk, self.pub = _load_keys(priv)
+        self.search_cache, self.history, self.read_cache = search_cache, history, read_cache
+        self.sids = SearchIds() # search id of the domains found, reused by the purchases
+        self.contact_ttl, self._contact_cache = 300., None # seconds the contact information is cached, and the cache
+        self.prefetch, self.prefetch_ttl, self.prefetch_stats = prefetch, 60., Counter() # speculative purchase offers
+        self._prefetched, self._revalidations = None, set()
+        self._own_client = client is None
+        self.client = client or mk_async_client()
+        self.auth = SherlockAuth(self.pk, API_URL, self.client, cache=_tokens_path() if cache else None)
+
+    @property
+    def atok(self): return self.auth.atok
+    @property
+    def rtok(self): return self.auth.rtok
+
+    async def authenticate(self):
+        "Authenticate with the server, returns the access & refresh tokens"
+        await self.auth.alogin()
+        return self.atok, self.rtok
+
+    async def aclose(self):
+        "Close the http client, releasing its pooled connections"
+        self.auth.cancel()
+        _discard_prefetch(self)
+        for t in self._revalidations: t.cancel()
+        if self._own_client: await self.client.aclose()
+
+    async def __aenter__(self): return self
+    async def __aexit__(self, *args): await self.aclose()
+
+    def __str__(self): return f"AsyncSherlock(pubkey={self.pub})"
+    __repr__ = __str__
+
+# %% ../nbs/05_aio.ipynb #319bd4e7
+@patch
+async def me(self: AsyncSherlock):
+    "Get authenticated user information"
+    r = await self.client.get(me_endpoint, auth=self.auth)
+    return _handle_response(r)
+
+@patch
+async def claim_account(self: AsyncSherlock, email: str):
+    "Claim an account by linking an email address"
+    return await alink_account_to_email(email, await self.auth.atoken(), API_URL, self.client)
+
+@patch
+async def search(self: AsyncSherlock,
+                 q: str, # query
+                 fresh: bool = False, # skip the search cache, e.g. to get a new search id for a purchase
+                 prefetch: bool = True, # prefetch the offers of the first domain found, if the client prefetches
+                 max_age: float = None): # answer from the history if `q` was searched less than `max_age` seconds ago
+    "Search for domains with a query. Returns prices in USD cents."
+    q = normalize_query(q)
+    c = self.search_cache
+    if c is not None and not fresh:
+        res = c.lookup(q)
+        if res is not None: return res
+    if self.history is not None and max_age is not None and not fresh:
+        # SQLite blocks, so the history is read off the event loop
+        res = await asyncio.get_running_loop().run_in_executor(None, self.history.lookup, q, max_age)
+        if res is not None: return res
+    r = await self.client.get(search_endpoint, params={"query": q})
+    res = _handle_response(r)
+    if c is not None: c.store(q, r, res)
+    if isinstance(res, dict):
+        self.sids.add(res)
+        if self.history is not None: # SQLite blocks, so the search is recorded off the event loop
+            await asyncio.get_running_loop().run_in_executor(None, self.history.record, q, res)
+        if self.prefetch and prefetch: self._prefetch_offers(q, res)
+    return res
+
+# %% ../nbs/05_aio.ipynb #19011141
+@patch
+async def search_many(self: AsyncSherlock,
+                      queries, # queries to search, equivalent queries are only searched once
+                      concurrency: int = 8, # max searches in flight
+                      max_age: float = None): # answer from the history the queries searched less than `max_age` seconds ago
+    "Search for many queries concurrently, yielding each result as it completes"
+    qs = _unique(queries, _query_key)
+    tasks = {asyncio.ensure_future(self.search(q, prefetch=False, max_age=max_age)): q for q in islice(qs, concurrency)}
+    try:
+        while tasks:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for t in done:
+                q = tasks.pop(t)
+                e = t.exception()
+                yield _search_result(q, None if e else t.result(), e)
+                for q in islice(qs, 1): tasks[asyncio.ensure_future(self.search(q, prefetch=False, max_age=max_age))] = q
+    finally:
+        for t in tasks: t.cancel()
+
+# %% ../nbs/05_aio.ipynb #1107a24a
+@patch
+async def find_domains(self: AsyncSherlock,
+                       candidates, # names to search, e.g. a generator of ideas
+                       k: int = 1, # number of domains to find
+                       max_price: int = None, # highest price, in USD cents
+                       tlds: list = None, # acceptable TLDs, any if None
+                       pred = None, # extra condition on each available domain (a search entry)
+                       concurrency: int = 8): # max searches in flight
+    "Search `candidates` concurrently, yielding the available domains matching the conditions until `k` are found"
+    if k <= 0: return
+    rs = self.search_many(candidates, concurrency)
+    try:
+        async for r in rs:
+            for o in _matches(r, max_price, tlds, pred):
+                yield o
+                k -= 1
+                if k == 0: return
+    finally: await rs.aclose()
+
+# %% ../nbs/05_aio.ipynb #016471e1
+@patch
+async def set_contact_information(self: AsyncSherlock,
+                                  cfn: str = '', # contact first name
+                                  cln: str = '', # contact last name
+                                  cem: str = '', # contact email
+                                  cadd: str = '', # contact address
+                                  cct: str = '', # contact city
+                                  cst: str = '', # contact state
+                                  cpc: str = '', # contact postal code
+                                  ccn: str = ''): # contact country
+    "Set the contact information for the Sherlock user"
+    data = _contact_payload(cfn, cln, cem, cadd, cct, cst, cpc, ccn)
+    r = await self.client.post(contact_endpoint, json=data, auth=self.auth)
+    res = _handle_response(r)
+    _store_contact(self, data)
+    return res
+
+@patch
+async def get_contact_information(self: AsyncSherlock,
+                                  fresh: bool = False): # skip the cached contact information
+    "Get the contact information for the Sherlock user."
+    c = None if fresh else _cached_contact(self)
+    if c is not None: return c
+    r = await self.client.get(contact_endpoint, auth=self.auth)
+    res = _handle_response(r)
+    _store_contact(self, res)
+    return res
+
+@patch
+async def _contact(self: AsyncSherlock):
+    "The configured contact information, raises if it is not valid"
+    return _valid_contact(Contact(**await self.get_contact_information()))
+
+# %% ../nbs/05_aio.ipynb #93dba582
+@patch
+async def _sid(self: AsyncSherlock,
+               sid: str, # search id, empty to find one for `domain`
+               domain: str): # domain
+    "`sid`, or the tracked search id of `domain`, searching it again if there is none"
+    if sid: return sid
+    return self.sids.sid(normalize_query(domain)) or (await self.search(domain, fresh=True, prefetch=False))['id']
+
+@patch
+async def get_purchase_offers(self: AsyncSherlock,
+                              sid: str, # search id, empty to reuse the last one of `domain` or search it again
+                              domain: str, # domain
+                              c: Contact, # contact information
+                              idempotency_key: str = None): # unique key that makes the request safe to retry
+    "Request available payment options for a domain."
+    sid = await self._sid(sid, domain)
+    offers = await self._prefetched_offers(sid, domain, c)
+    if offers is not None: return offers
+    r = await self.client.post(get_offers_endpoint, json=_get_offers_payload(domain, c, sid), auth=self.auth,
+                               headers=_mk_headers(idempotency_key=idempotency_key))
+    return _handle_response(r)
+
+@patch
+async def _offers_task(self: AsyncSherlock, sid: str, domain: str):
+    "Contact information and purchase offers of `domain`, fetched in the background"
+    c = await self._contact()
+    r = await self.client.post(get_offers_endpoint, json=_get_offers_payload(domain, c, sid), auth=self.auth)
+    return c.asdict(), _handle_response(r)
+
+@patch
+def _prefetch_offers(self: AsyncSherlock, q: str, res: dict):
+    "Start fetching the purchase offers of the domain of the search response `res` most likely to be bought"
+    domain = _first_available(q, res)
+    if domain is None: return
+    _discard_prefetch(self)
+    self._prefetched = (res['id'], domain), time.monotonic(), asyncio.ensure_future(self._offers_task(res['id'], domain))
+    self.prefetch_stats['started'] += 1
+
+@patch
+async def _prefetched_offers(self: AsyncSherlock, sid: str, domain: str, c: Contact):
+    "Prefetched purchase offers of `domain` for the contact `c`, None if there are none"
+    t = _take_prefetch(self, sid, domain)
+    if t is None: return None
+    try: return _prefetch_result(self, c, await t, None)
+    except Exception as e: return _prefetch_result(self, c, None, e)
+
+@patch
+async def get_payment_details(self: AsyncSherlock,
+                              prurl: str, # payment request url
+                              oid: str, # offer id
+                              pm: str, # payment method
+                              pct: str, # payment context token
+                              idempotency_key: str = None): # unique key that makes the request safe to retry
+    "Get payment details for an offer."
+    r = await self.client.post(prurl, json=_payment_payload(oid, pm, pct), headers=_mk_headers(idempotency_key=idempotency_key))
+    return _handle_response(r)
+
+@patch
+async def request_payment_details(self: AsyncSherlock,
+                                  sid: str, # search id
+                                  domain: str, # domain
+                                  payment_method: str = 'credit_card', # payment method {'credit_card', 'lightning'}
+                                  contact: Contact = None): # contact information
+    "Request payment information for purchasing a domain. Returns the details needed to complete the payment (like a checkout URL)."
+    if not contact: contact = await self._contact()
+    offers = await self.get_purchase_offers(sid, domain, _valid_contact(contact))
+    return await self.get_payment_details(*_first_offer(offers, payment_method))
+
+@patch
+async def get_x402_purchase_offers(self: AsyncSherlock,
+                                   sid: str, # search id, empty to reuse the last one of `domain` or search it again
+                                   domain: str, # domain
+                                   c: Contact): # contact information
+    "Request X402 payment requirements for a domain purchase."
+    r = await self.client.post(get_x402_offers_endpoint, json=_get_offers_payload(domain, c, await self._sid(sid, domain)), auth=self.auth)
+    return _handle_response(r)
+
+@patch
+async def purchase_x402(self: AsyncSherlock,
+                        sid: str, # search id, empty to reuse the last one of `domain` or search it again
+                        domain: str, # domain
+                        payment_signature: str, # PAYMENT-SIGNATURE header value
+                        c: Contact, # contact information
+                        idempotency_key: str = None): # unique key that makes the request safe to retry
+    "Complete an X402 domain purchase with a payment signature."
+    r = await self.client.post(get_x402_offers_endpoint, json=_get_offers_payload(domain, c, await self._sid(sid, domain)),
+                               auth=self.auth, headers=_x402_headers(payment_signature, idempotency_key))
+    return _handle_response(r)
+
+# %% ../nbs/05_aio.ipynb #5a79a7f3
+@patch
+async def _purchase_one(self: AsyncSherlock, sid: str, domain: str, pm: str, c: Contact, ck: _Checkpoint):
+    "Row of a bulk purchase for `domain`, skipping the steps recorded in `ck`"
+    if ck.get(domain, 'payment') is not None: return _purchase_result(ck, domain, resumed=True)
+    try:
+        if ck.get(domain, 'offers') is None:
+            sid = await self._sid(sid, domain)
+            ck.add(domain, sid=sid, offers=await self.get_purchase_offers(sid, domain, c, ck.key(domain, 'offers')))
+        ck.add(domain, payment=await self.get_payment_details(*_first_offer(ck.get(domain, 'offers'), pm), ck.key(domain, 'payment')))
+    except Exception as e: return _purchase_result(ck, domain, err=e)
+    return _purchase_result(ck, domain)
+
+@patch
+async def purchase_many(self: AsyncSherlock,
+                        items, # (search id, domain) pairs, an empty search id reuses the last one of the domain or searches it again
+                        payment_method: str = 'credit_card', # payment method {'credit_card', 'lightning'}
+                        concurrency: int = 8, # max domains purchased at once
+                        checkpoint: str = None): # file recording the steps done, so running the batch again resumes it
+    "Request the payment details of many domains concurrently, returning a row per domain"
+    items, c, sem = _purchase_items(items), await self._contact(), asyncio.Semaphore(concurrency)
+    async def _one(sid, domain):
+        async with sem: return await self._purchase_one(sid, domain, payment_method, c, ck)
+    with _Checkpoint(checkpoint) as ck: return list(await asyncio.gather(*(_one(*o) for o in items)))
+
+# %% ../nbs/05_aio.ipynb #db6f073b
+@patch
+async def _revalidate(self: AsyncSherlock, url: str):
+    "GET `url`, conditionally if its response is cached, updating the read cache"
+    c, k = self.read_cache, _read_key(self, url)
+    v = c.version(k)
+    try: r = await self.client.get(url, auth=self.auth, headers=c.headers(k))
+    finally: c.refreshed(k)
+    res = _cached_response(c, k, r, v)
+    return await self._revalidate(url) if res is None else res
+
+def _retrieve(t):
+    "Retrieve the error of the revalidation task `t`: a failed revalidation just keeps the stale response"
+    if not t.cancelled(): t.exception()
+
+@patch
+async def _read(self: AsyncSherlock,
+                url: str, # url to GET
+                fresh: bool = False): # revalidate the cached response before returning it
+    "GET `url` through the read cache, serving a stale response while it is revalidated in the background"
+    c = self.read_cache
+    if c is None: return _handle_response(await self.client.get(url, auth=self.auth))
+    if not fresh:
+        res, stale = c.lookup(_read_key(self, url))
+        if res is not None:
+            if stale and c.refresh(_read_key(self, url)):
+                t = asyncio.ensure_future(self._revalidate(url))
+                self._revalidations.add(t)
+                t.add_done_callback(self._revalidations.discard)
+                t.add_done_callback(_retrieve)
+            return res
+    return await self._revalidate(url)
+
+# %% ../nbs/05_aio.ipynb #5b993b1c
+@patch
+async def domains(self: AsyncSherlock,
+                  fresh: bool = False): # revalidate the cached domain list, if the client has a read cache
+    "List of domains owned by the authenticated user"
+    return await self._read(domains_endpoint, fresh)
+
+@patch
+async def update_nameservers(self: AsyncSherlock,
+                             domain_id: str, # domain id
+                             nameservers: list[str], # nameservers
+                             idempotency_key: str = None): # unique key that makes the request safe to retry
+    "Update the nameserver list for a domain"
+    try: r = await self.client.patch(_nameservers_endpoint(domain_id), json={"nameservers": nameservers}, auth=self.auth,
+                                     headers=_mk_headers(idempotency_key=idempotency_key))
+    finally: _invalidate(self, domains_endpoint, _dns_endpoint(domain_id))
+    return _handle_response(r)
+
+@patch
+async def dns_records(self: AsyncSherlock,
+                      domain_id: str, # domain id
+                      fresh: bool = False): # revalidate the cached records, if the client has a read cache
+    "Get DNS records for a domain."
+    return await self._read(_dns_endpoint(domain_id), fresh)
+
+@patch
+async def create_dns(self: AsyncSherlock,
+                     domain_id: str, # domain id
+                     type: str = "TXT", # type
+                     name: str = "test", # name
+                     value: str = "test-1", # value
+                     ttl: int = 3600, # ttl
+                     idempotency_key: str = None): # unique key that makes the request safe to retry
+    "Create a new DNS record"
+    try: r = await self.client.post(_dns_endpoint(domain_id), auth=self.auth, headers=_mk_headers(idempotency_key=idempotency_key),
+                                    json=_dns_payload(type, name, value, ttl))
+    finally: _invalidate(self, _dns_endpoint(domain_id))
+    return _handle_response(r)
+
+@patch
+async def update_dns(self: AsyncSherlock,
+                     domain_id: str, # domain id
+                     record_id: str, # record id
+                     type: str = "TXT", # type
+                     name: str = "test-2", # name
+                     value: str = "test-2", # value
+                     ttl: int = 3600, # ttl
+                     idempotency_key: str = None): # unique key that makes the request safe to retry
+    "Update a DNS record"
+    try: r = await self.client.patch(_dns_endpoint(domain_id), auth=self.auth, headers=_mk_headers(idempotency_key=idempotency_key),
+                                     json=_dns_payload(type, name, value, ttl, record_id))
+    finally: _invalidate(self, _dns_endpoint(domain_id))
+    return _handle_response(r)
+
+@patch
+async def delete_dns(self: AsyncSherlock,
+                     domain_id: str, # domain id
+                     record_id: str): # record id
+    "Delete a DNS record"
+    try: r = await self.client.delete(_dns_endpoint(domain_id, record_id), auth=self.auth)
+    finally: _invalidate(self, _dns_endpoint(domain_id))
+    return _handle_response(r)
+
+# %% ../nbs/05_aio.ipynb #5ce97384
+@patch
+async def iter_domains(self: AsyncSherlock,
+                       chunk_size: int = 2**16): # characters of the response parsed at a time
+    "Domains owned by the authenticated user, yielded one at a time while the list downloads"
+    p = _JSONItems()
+    async with self.client.stream('GET', domains_endpoint, auth=self.auth) as r:
+        r.raise_for_status()
+        async for t in r.aiter_text(chunk_size):
+            for d in p.feed(t): yield d
+        for d in p.feed('', final=True): yield d
+
+# %% ../nbs/05_aio.ipynb #bbb4d8e2
+@patch
+async def wait_for_domains(self: AsyncSherlock,
+                           domains, # domain names, e.g. the ones just purchased
+                           timeout: float = 600, # seconds to wait before raising `TimeoutError`
+                           status: str = 'active', # status to wait for
+                           interval: float = 2, # first delay between polls, in seconds
+                           max_interval: float = 60): # longest delay between polls, in seconds
+    "Poll the domain list until each of `domains` has `status`, yielding each domain as soon as it does"
+    w = _DomainWaiter(domains, timeout, status, interval, max_interval)
+    while w.pending:
+        for d in w.update(await self.domains(fresh=True)): yield d
+        if w.pending: await asyncio.sleep(w.wait())
+
+@patch
+async def wait_for_domain(self: AsyncSherlock,
+                          domain: str, # domain name
+                          timeout: float = 600, # seconds to wait before raising `TimeoutError`
+                          status: str = 'active', # status to wait for
+                          interval: float = 2, # first delay between polls, in seconds
+                          max_interval: float = 60): # longest delay between polls, in seconds
+    "Wait until `domain` has `status`, returning it"
+    return first([d async for d in self.wait_for_domains([domain], timeout, status, interval, max_interval)])
+
+# %% ../nbs/05_aio.ipynb #be26cd7c
+def _tool(f):
+    "Reuse the docstring of the `Sherlock` tool with the same name"
+    f.__doc__ = getattr(Sherlock, f.__name__).__doc__
+    return f
+
+@patch
+@_tool
+async def _me(self: AsyncSherlock): return await self.me()
+
+@patch
+@_tool
+async def _claim_account(self: AsyncSherlock, email: str): return await self.claim_account(email)
+
+@patch
+@_tool
+async def _search(self: AsyncSherlock, q: str):
+    try: return await self.search(q)
+    except InvalidQuery as e: return e.asdict()
+
+@patch
+@_tool
+async def _set_contact_information(self: AsyncSherlock,
+                                   first_name: str = '',
+                                   last_name: str = '',
+                                   email: str = '',
+                                   address: str = '',
+                                   city: str = '',
+                                   state: str = '',
+                                   postal_code: str = '',
+                                   country: str = ''):
+    return await self.set_contact_information(first_name, last_name, email, address, city, state, postal_code, country)
+
+@patch
+@_tool
+async def _get_contact_information(self: AsyncSherlock): return await self.get_contact_information()
+
+@patch
+@_tool
+async def _get_purchase_offers(self: AsyncSherlock,
+                               sid: str, # search id
+                               domain: str): # domain
+    return await self.get_purchase_offers(sid, domain, await self._contact())
+
+@patch
+@_tool
+async def _request_payment_details(self: AsyncSherlock,
+                                   sid: str, # search id
+                                   domain: str, # domain
+                                   payment_method: str = 'credit_card'): # payment method {'credit_card', 'lightning'}
+    return await self.request_payment_details(sid, domain, payment_method, await self._contact())
+
+@patch
+@_tool
+async def _get_x402_purchase_offers(self: AsyncSherlock,
+                                    sid: str, # search id
+                                    domain: str): # domain
+    return await self.get_x402_purchase_offers(sid, domain, await self._contact())
+
+@patch
+@_tool
+async def _purchase_x402(self: AsyncSherlock,
+                         sid: str, # search id
+                         domain: str, # domain
+                         payment_signature: str): # PAYMENT-SIGNATURE header value
+    return await self.purchase_x402(sid, domain, payment_signature, await self._contact())
+
+@patch
+@_tool
+async def _domains(self: AsyncSherlock, cursor: str = '', limit: int = 50):
+    start, limit = _cursor(cursor), _limit(limit)
+    if self.read_cache is not None: return _page(start, (await self.domains())[start:], limit)
+    ds, items, i = self.iter_domains(), [], 0
+    try:
+        async for d in ds:
+            if i >= start: items.append(d)
+            if len(items) > limit: break
+            i += 1
+    finally: await ds.aclose()
+    return _page(start, items, limit)
+
+@patch
+@_tool
+async def _update_nameservers(self: AsyncSherlock, domain_id: str, nameservers: list[str]):
+    return await self.update_nameservers(domain_id, nameservers)
+
+@patch
+@_tool
+async def _dns_records(self: AsyncSherlock, domain_id: str): return await self.dns_records(domain_id)
+
+@patch
+@_tool
+async def _create_dns_record(self: AsyncSherlock,
+                             domain_id: str, # domain id
+                             type: str = "TXT", # type
+                             name: str = "test", # name
+                             value: str = "test-1", # value
+                             ttl: int = 3600): # ttl
+    return await self.create_dns(domain_id, type, name, value, ttl)
+
+@patch
+@_tool
+async def _update_dns_record(self: AsyncSherlock,
+                             domain_id: str, # domain id
+                             record_id: str, # record id
+                             type: str = "TXT", # type
+                             name: str = "test-2", # name
+                             value: str = "test-2", # value
+                             ttl: int = 3600): # ttl
+    return await self.update_dns(domain_id, record_id, type, name, value, ttl)
+
+@patch
+@_tool
+async def _delete_dns_record(self: AsyncSherlock,
+                             domain_id: str, # domain id
+                             record_id: str): # record id
+    return await self.delete_dns(domain_id, record_id)
+
+# %% ../nbs/05_aio.ipynb #034339b3
+@patch
+def as_tools(self: AsyncSherlock):
+    "Return the AsyncSherlock class as a list of async tools, the same ones `Sherlock.as_tools` returns"
+    return Sherlock.as_tools(self)
@@ -3,15 +3,19 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/02_auth.ipynb.
 
 # %% auto #0
-__all__ = ['authenticate', 'link_account_to_email']
+__all__ = ['authenticate', 'link_account_to_email', 'aauthenticate', 'alink_account_to_email', 'refresh', 'arefresh',
+           'SherlockAuth']
 
-# %% ../nbs/02_auth.ipynb #97763843
+# %% ../nbs/02_auth.ipynb #92558fbd
 import httpx
-from cryptography.hazmat.primitives.asymmetric import ed25519
+import base64, json, threading, time, weakref
+from collections import Counter
+from fastcore.basics import patch, store_attr
 
+from .config import load_tokens, save_tokens
 from .crypto import *
 
-# %% ../nbs/02_auth.ipynb #9eb6a443
+# %% ../nbs/02_auth.ipynb #232356bd
 def _handle_response(r):
     "Process response: raise for status and return json if possible."
     r.raise_for_status()
@@ -19,24 +23,26 @@ def _handle_response(r):
     except: return r
 
 def _get_challenge(pub_key: str, # public key
-                   base_url: str = "https://api.sherlockdomains.com"): # base url
+                   base_url: str = "https://api.sherlockdomains.com", # base url
+                   client: httpx.Client = None): # http client, a one-off connection is used if not provided
     "Get authentication challenge for a public key"
-    r = httpx.post(f"{base_url}/api/v0/auth/challenge", json={"public_key": pub_key})
+    r = (client or httpx).post(f"{base_url}/api/v0/auth/challenge", json={"public_key": pub_key})
     return _handle_response(r)['challenge']
 
-# %% ../nbs/02_auth.ipynb #0a195ede
-def _sign_challenge(pk: ed25519.Ed25519PrivateKey, 
+# %% ../nbs/02_auth.ipynb #fb59ba1b
+def _sign_challenge(pk: 'ed25519.Ed25519PrivateKey', 
                     c: str): # challenge
     "Sign a challenge with a private key"
     return pk.sign(bytes.fromhex(c)).hex()
 
-# %% ../nbs/02_auth.ipynb #a7d1d573
+# %% ../nbs/02_auth.ipynb #e5f6db60
 def _submit_challenge(pub: str, # public key
                       c: str, # challenge
                       sig: str, # signature
-                      base_url: str = "https://api.sherlockdomains.com"): # base url
+                      base_url: str = "https://api.sherlockdomains.com", # base url
+                      client: httpx.Client = None): # http client, a one-off connection is used if not provided
     "Submit a challenge and signature to the server to get access and refresh tokens"
-    r = httpx.post(f"{base_url}/api/v0/auth/login", json={
+    r = (client or httpx).post(f"{base_url}/api/v0/auth/login", json={
         "public_key": pub,
         "challenge": c,
         "signature": sig
@@ -44,21 +50,229 @@ def _submit_challenge(pub: str, # public key
     r = _handle_response(r)
     return r['access'], r['refresh']
 
-# %% ../nbs/02_auth.ipynb #e282597a
-def authenticate(priv: ed25519.Ed25519PrivateKey, # private key
-                 base_url: str = "https://api.sherlockdomains.com"): # base url
+# %% ../nbs/02_auth.ipynb #61136fdb
+def authenticate(priv: 'ed25519.Ed25519PrivateKey', # private key
+                 base_url: str = "https://api.sherlockdomains.com", # base url
+                 client: httpx.Client = None): # http client, a one-off connection is used if not provided
     "Authenticate with the server and return access and refresh tokens"
     pub = priv.public_key().public_bytes_raw().hex()
-    c = _get_challenge(pub, base_url)
+    c = _get_challenge(pub, base_url, client)
     sig = _sign_challenge(priv, c)
-    return _submit_challenge(pub, c, sig, base_url)
+    return _submit_challenge(pub, c, sig, base_url, client)
 
-# %% ../nbs/02_auth.ipynb #0f20175e
-def link_account_to_email(email: str, auth_token: str, base_url: str = "https://api.sherlockdomains.com") -> None:
-    r = httpx.post(
+# %% ../nbs/02_auth.ipynb #a2e21cde
+def link_account_to_email(email: str, auth_token: str, base_url: str = "https://api.sherlockdomains.com",
+                          client: httpx.Client = None) -> None:
+    r = (client or httpx).post(
         f"{base_url}/api/v0/auth/email-link",
         headers={"Authorization": f"Bearer {auth_token}"},
         json={"email": email}
     )
     return _handle_response(r)
 
+# %% ../nbs/02_auth.ipynb #c8f0af72
+async def aauthenticate(priv: 'ed25519.Ed25519PrivateKey', # private key
+                        base_url: str = "https://api.sherlockdomains.com", # base url
+                        client: httpx.AsyncClient = None): # async http client
+    "Async version of `authenticate`"
+    pub = priv.public_key().public_bytes_raw().hex()
+    r = await client.post(f"{base_url}/api/v0/auth/challenge", json={"public_key": pub})
+    c = _handle_response(r)['challenge']
+    r = await client.post(f"{base_url}/api/v0/auth/login", json={
+        "public_key": pub,
+        "challenge": c,
+        "signature": _sign_challenge(priv, c)
+    })
+    r = _handle_response(r)
+    return r['access'], r['refresh']
+
+async def alink_account_to_email(email: str, auth_token: str, base_url: str = "https://api.sherlockdomains.com",
+                                 client: httpx.AsyncClient = None) -> None:
+    "Async version of `link_account_to_email`"
+    r = await client.post(
+        f"{base_url}/api/v0/auth/email-link",
+        headers={"Authorization": f"Bearer {auth_token}"},
+        json={"email": email}
+    )
+    return _handle_response(r)
+
+
+# %% ../nbs/02_auth.ipynb #c19b6948
+def _exp(tok: str): # JWT
+    "Expiry timestamp of the JWT `tok`, None if it doesn't have one"
+    try:
+        p = tok.split('.')[1]
+        return json.loads(base64.urlsafe_b64decode(p + '=' * (-len(p) % 4))).get('exp')
+    except (AttributeError, IndexError, ValueError): return None
+
+# %% ../nbs/02_auth.ipynb #8ffaabe1
+def refresh(rtok: str, # refresh token
+            base_url: str = "https://api.sherlockdomains.com", # base url
+            client: httpx.Client = None): # http client, a one-off connection is used if not provided
+    "Exchange a refresh token for new access and refresh tokens"
+    r = _handle_response((client or httpx).post(f"{base_url}/api/v0/auth/refresh", json={"refresh": rtok}))
+    return r['access'], r.get('refresh', rtok)
+
+async def arefresh(rtok: str, # refresh token
+                   base_url: str = "https://api.sherlockdomains.com", # base url
+                   client: httpx.AsyncClient = None): # async http client
+    "Async version of `refresh`"
+    r = _handle_response(await client.post(f"{base_url}/api/v0/auth/refresh", json={"refresh": rtok}))
+    return r['access'], r.get('refresh', rtok)
+
+# %% ../nbs/02_auth.ipynb #2bd614e2
+def _dead(e: httpx.HTTPStatusError):
+    "Whether a refresh failed on the request rather than on the server: the refresh token is dead or the route unavailable, so a login can replace it"
+    return 400 <= e.response.status_code < 500
+
+class SherlockAuth(httpx.Auth):
+    "Bearer auth for the Sherlock API, renewing the access token before it expires and on 401 responses"
+    def __init__(self,
+                 pk: 'ed25519.Ed25519PrivateKey', # private key
+                 base_url: str = "https://api.sherlockdomains.com", # base url
+                 client = None, # `httpx.Client` or `httpx.AsyncClient` sending the auth requests
+                 margin: float = 60., # seconds before expiry the access token is renewed
+                 background: bool = True, # renew the access token on a background timer
+                 cache = None): # file caching the tokens across processes (see `save_tokens`), not cached if None
+        store_attr()
+        self.pub = pk.public_key().public_bytes_raw().hex()
+        self.atok = self.rtok = self.timer = self.alock = None
+        self.renew_at, self.lock = 0., threading.Lock()
+        self.stats = Counter() # logins and refreshes made
+        toks = load_tokens(base_url, self.pub, cache) if cache else None
+        if toks:
+            self._use(toks)
+            self._schedule()
+
+    def _use(self, toks):
+        self.atok, self.rtok = toks
+        exp, now = _exp(self.atok), time.time()
+        # renew `margin` seconds before expiry, or halfway through the lifetime of short-lived tokens
+        self.renew_at = float('inf') if exp is None else exp - min(self.margin, (exp - now)/2)
+
+    def _set(self, toks, kind):
+        "Store new tokens, caching them and scheduling their renewal"
+        self._use(toks)
+        self.stats[kind] += 1
+        if self.cache: save_tokens(self.base_url, self.pub, *toks, self.cache)
+        self._schedule()
+        return self.atok
+
+    def _refreshable(self):
+        exp = _exp(self.rtok)
+        return self.rtok is not None and (exp is None or exp > time.time())
+
+    def _stale(self, tok): return tok is None or time.time() >= self.renew_at
+
+    def cancel(self):
+        "Stop the background renewal"
+        if self.timer is not None: self.timer.cancel()
+
+    def __del__(self): self.cancel() # a client dropped without being closed stops renewing
+
+# %% ../nbs/02_auth.ipynb #678afec8
+@patch
+def login(self: SherlockAuth):
+    "Authenticate with the challenge flow, returns the access token"
+    with self.lock: return self._set(authenticate(self.pk, self.base_url, self.client), 'login')
+
+@patch
+def renew(self: SherlockAuth,
+          stale: str = None): # token found to be stale, nothing is done if it was already replaced
+    "Renew the access token with the refresh token, logging in again if it is dead"
+    with self.lock:
+        if self.atok != stale: return self.atok
+        if self._refreshable():
+            try: return self._set(refresh(self.rtok, self.base_url, self.client), 'refresh')
+            except httpx.HTTPStatusError as e:
+                if not _dead(e): raise
+        return self._set(authenticate(self.pk, self.base_url, self.client), 'login')
+
+@patch
+def token(self: SherlockAuth):
+    "A valid access token, renewed if needed"
+    tok = self.atok
+    return self.renew(tok) if self._stale(tok) else tok
+
+@patch
+def _background(self: SherlockAuth, tok):
+    try: self.renew(tok)
+    except Exception: pass # the next request renews it instead
+
+@patch
+def sync_auth_flow(self: SherlockAuth, request):
+    tok = self.token()
+    request.headers['Authorization'] = f"Bearer {tok}"
+    response = yield request
+    if response.status_code == 401:
+        request.headers['Authorization'] = f"Bearer {self.renew(tok)}"
+        yield request
+
+# %% ../nbs/02_auth.ipynb #11972ba5
+@patch
+def _async_lock(self: SherlockAuth):
+    import asyncio # only loaded by async clients, it is slow to import
+    if self.alock is None: self.alock = asyncio.Lock()
+    return self.alock
+
+@patch
+async def alogin(self: SherlockAuth):
+    "Async version of `login`"
+    async with self._async_lock(): return self._set(await aauthenticate(self.pk, self.base_url, self.client), 'login')
+
+@patch
+async def arenew(self: SherlockAuth, stale: str = None):
+    "Async version of `renew`"
+    async with self._async_lock():
+        if self.atok != stale: return self.atok
+        if self._refreshable():
+            try: return self._set(await arefresh(self.rtok, self.base_url, self.client), 'refresh')
+            except httpx.HTTPStatusError as e:
+                if not _dead(e): raise
+        return self._set(await aauthenticate(self.pk, self.base_url, self.client), 'login')
+
+@patch
+async def atoken(self: SherlockAuth):
+    "Async version of `token`"
+    tok = self.atok
+    return await self.arenew(tok) if self._stale(tok) else tok
+
+@patch
+async def _abackground(self: SherlockAuth, tok):
+    try: await self.arenew(tok)
+    except Exception: pass
+
+@patch
+async def async_auth_flow(self: SherlockAuth, request):
+    tok = await self.atoken()
+    request.headers['Authorization'] = f"Bearer {tok}"
+    response = yield request
+    if response.status_code == 401:
+        request.headers['Authorization'] = f"Bearer {await self.arenew(tok)}"
+        yield request
+
+# %% ../nbs/02_auth.ipynb #d7098721
+def _renew_later(ref, tok, sync=True):
+    "Background renewal of the `SherlockAuth` referenced by `ref`, unless it was garbage-collected"
+    auth = ref()
+    if auth is None: return
+    if sync: auth._background(tok)
+    else:
+        import asyncio
+        asyncio.ensure_future(auth._abackground(tok))
+
+@patch
+def _schedule(self: SherlockAuth):
+    "Renew the access token in the background when it gets stale"
+    self.cancel()
+    if not self.background or self.renew_at == float('inf'): return
+    delay, args = max(0., self.renew_at - time.time()), (weakref.ref(self), self.atok)
+    if isinstance(self.client, httpx.AsyncClient):
+        import asyncio
+        try: loop = asyncio.get_running_loop()
+        except RuntimeError: return # created outside the event loop, the first request renews the token when it gets stale
+        self.timer = loop.call_later(delay, _renew_later, *args, False)
+    else:
+        self.timer = threading.Timer(delay, _renew_later, args)
+        self.timer.daemon = True
+        self.timer.start()
@@ -0,0 +1,150 @@
+"""In-memory caches for Sherlock API responses."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/07_cache.ipynb.
+
+# %% auto #0
+__all__ = ['TTLCache', 'SearchIds', 'ReadCache']
+
+# %% ../nbs/07_cache.ipynb #03eed296
+import json, threading, time
+from collections import Counter, OrderedDict
+from fastcore.basics import store_attr
+
+# %% ../nbs/07_cache.ipynb #08bb99b8
+class TTLCache:
+    "Thread-safe LRU cache whose entries expire after a TTL, bounded by number of entries and total size"
+    def __init__(self,
+                 maxsize: int = 1024, # max entries
+                 maxbytes: int = 16*2**20): # max total size of the entries
+        store_attr()
+        self.d, self.nbytes, self.lock = OrderedDict(), 0, threading.RLock() # key -> (expiry, size, value)
+        self.stats = Counter()
+
+    def _drop(self, key):
+        _, size, _ = self.d.pop(key)
+        self.nbytes -= size
+
+    def get(self, key, default=None):
+        "Value of `key`, or `default` if it is missing or expired"
+        with self.lock:
+            e = self.d.get(key)
+            if e is not None and e[0] <= time.monotonic():
+                self._drop(key)
+                self.stats['expired'] += 1
+                e = None
+            if e is None:
+                self.stats['misses'] += 1
+                return default
+            self.d.move_to_end(key)
+            self.stats['hits'] += 1
+            return e[2]
+
+    def set(self,
+            key, # cache key
+            value, # value to cache
+            ttl: float, # seconds before the entry expires
+            size: int = None): # size of `value` in bytes, defaults to `len(value)`
+        "Cache `value` for `ttl` seconds, evicting the least recently used entries if the cache is full"
+        size = len(value) if size is None else size
+        with self.lock:
+            if key in self.d: self._drop(key)
+            if size > self.maxbytes: return
+            self.d[key] = (time.monotonic() + ttl, size, value)
+            self.nbytes += size
+            while len(self.d) > self.maxsize or self.nbytes > self.maxbytes:
+                self._drop(next(iter(self.d)))
+                self.stats['evictions'] += 1
+
+    def pop(self, key):
+        "Remove `key` from the cache"
+        with self.lock:
+            if key in self.d: self._drop(key)
+
+    def clear(self):
+        "Remove every entry"
+        with self.lock: self.d.clear(); self.nbytes = 0
+
+    def __len__(self): return len(self.d)
+    def __repr__(self): return f"{type(self).__name__}({len(self)} entries, {self.nbytes} bytes, {dict(self.stats)})"
+
+# %% ../nbs/07_cache.ipynb #b22bcfc2
+class SearchIds(TTLCache):
+    "Search id and issue time of the available domains found by searches, kept for `ttl` seconds"
+    def __init__(self,
+                 ttl: float = 600., # seconds a search id is reused for a purchase
+                 maxsize: int = 4096): # max domains tracked
+        super().__init__(maxsize, maxbytes=maxsize)
+        self.ttl = ttl
+
+    def add(self, res: dict): # search response
+        "Track the search id of the available domains of `res`"
+        e = (res['id'], time.time())
+        for o in res.get('available') or (): self.set(o['name'], e, self.ttl, size=1)
+
+    def sid(self, domain: str):
+        "Search id of `domain`, None if there is no valid one"
+        e = self.get(domain)
+        return None if e is None else e[0]
+
+# %% ../nbs/07_cache.ipynb #3fa6b855
+class ReadCache(TTLCache):
+    "`TTLCache` of GET responses, served stale while they are revalidated with their `ETag` or `Last-Modified` date"
+    def __init__(self,
+                 ttl: float = 30., # seconds a response is fresh
+                 stale_ttl: float = 600., # seconds a stale response is still served while it is revalidated
+                 maxsize: int = 256, # max responses
+                 maxbytes: int = 16*2**20): # max total size of the responses
+        super().__init__(maxsize, maxbytes)
+        self.ttl, self.stale_ttl = ttl, stale_ttl
+        self.versions, self.refreshing = Counter(), set()
+
+    def _set(self, key, e): self.set(key, e, self.ttl + self.stale_ttl, size=len(e[3]))
+
+    def lookup(self, key):
+        "Cached body of `key` and whether it is stale, (None, False) if there is none"
+        e = self.get(key)
+        if e is None: return None, False
+        return json.loads(e[3]), e[0] <= time.monotonic() # a new copy, callers can modify it
+
+    def version(self, key):
+        "Number of invalidations of `key`, to read before requesting it"
+        with self.lock: return self.versions[key]
+
+    def headers(self, key):
+        "Conditional request headers revalidating the cached response of `key`"
+        with self.lock: e = self.d.get(key)
+        if e is None: return {}
+        _, etag, modified, _ = e[2]
+        return {k: v for k, v in (('If-None-Match', etag), ('If-Modified-Since', modified)) if v}
+
+    def store(self, key, r, version: int): # response to the GET of `key`, `version` of `key` before the request
+        "Cache the response `r`, unless `key` was invalidated since the request"
+        with self.lock: # checked and stored at once, so an invalidation can't come in between
+            if self.versions[key] != version: return
+            self._set(key, (time.monotonic() + self.ttl, r.headers.get('etag'), r.headers.get('last-modified'), r.content))
+
+    def revalidated(self, key):
+        "Body of the cached response of `key`, fresh again after a 304 answer. None if it is no longer cached"
+        with self.lock: e = self.d.get(key)
+        if e is None: return None
+        self._set(key, (time.monotonic() + self.ttl, *e[2][1:]))
+        self.stats['revalidated'] += 1
+        return json.loads(e[2][3])
+
+    def refresh(self, key):
+        "Whether to start revalidating `key` in the background, False if it already is"
+        with self.lock:
+            if key in self.refreshing: return False
+            self.refreshing.add(key)
+            return True
+
+    def refreshed(self, key):
+        "Mark the revalidation of `key` as done"
+        with self.lock: self.refreshing.discard(key)
+
+    def invalidate(self, *keys):
+        "Drop the responses of `keys`, and the revalidations of them in flight"
+        for k in keys:
+            with self.lock:
+                self.versions[k] += 1
+                self.pop(k)
@@ -3,34 +3,82 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/03_config.ipynb.
 
 # %% auto #0
-__all__ = ['SherlockConfig', 'get_cfg', 'save_cfg']
+__all__ = ['SherlockConfig', 'get_cfg', 'save_cfg', 'load_tokens', 'save_tokens']
 
-# %% ../nbs/03_config.ipynb #5acbff57
-from fastcore.all import *
-from fastcore.xdg import *
+# %% ../nbs/03_config.ipynb #1c011cc5
+from fastcore.foundation import Config, save_config_file
 from typing import get_type_hints
-from dataclasses import dataclass
-import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+import json, os, threading
 
-# %% ../nbs/03_config.ipynb #c4dc098f
+# %% ../nbs/03_config.ipynb #1dd6d00b
 @dataclass
 class SherlockConfig:
     priv: str = ''  # private key (hex)
 
-def _cfg_path(): return xdg_config_home() / 'sherlock' / 'sherlock.conf'
+def _xdg_config_home():
+    "Same as `fastcore.xdg.xdg_config_home`, which would import all of `fastcore.utils`"
+    p = os.environ.get('XDG_CONFIG_HOME')
+    return Path(p) if p and os.path.isabs(p) else Path.home()/'.config'
+
+def _cfg_path(): return _xdg_config_home() / 'sherlock' / 'sherlock.conf'
 _cfg_path()
 
-# %% ../nbs/03_config.ipynb #2a10607f
+# %% ../nbs/03_config.ipynb #b18176c3
+_cfgs = {} # parsed configs, with the mtime and size of their file, by path
+
+def _stamp(path):
+    try: st = path.stat()
+    except FileNotFoundError: return None
+    return st.st_mtime_ns, st.st_size
+
 def get_cfg(path = None):
-    "Get config from XDG config dir, creating if needed"
-    if path is None: path = _cfg_path()
+    "Get config from XDG config dir, creating if needed. The parsed config is cached until the file changes"
+    path = Path(path or _cfg_path())
+    stamp, hit = _stamp(path), _cfgs.get(path)
+    if hit and stamp and hit[0] == stamp: return hit[1]
     path.parent.mkdir(parents=True, exist_ok=True)
     _types = get_type_hints(SherlockConfig)
-    return Config(path.parent, path.name, create=asdict(SherlockConfig()),
+    cfg = Config(path.parent, path.name, create=asdict(SherlockConfig()),
                  types=_types, inline_comment_prefixes=('#'))
+    _cfgs[path] = _stamp(path), cfg
+    return cfg
 
 def save_cfg(cfg: dict, path = None):
     "Save config to file"
-    if path is None: path = _cfg_path()
+    path = Path(path or _cfg_path())
     path.parent.mkdir(parents=True, exist_ok=True)
     save_config_file(path, cfg)
+    _cfgs.pop(path, None)
+
+# %% ../nbs/03_config.ipynb #524bea3a
+def _tokens_path(): return _cfg_path().parent / 'tokens.json'
+
+def _tokens_key(base_url, pub): return f"{pub}@{base_url.rstrip('/')}"
+
+def load_tokens(base_url: str, # API url the tokens were issued by
+                pub: str, # public key
+                path = None): # cache file, defaults to `tokens.json` in the config dir
+    "Cached access and refresh tokens of `pub` on `base_url`, None if there are none"
+    path = Path(path or _tokens_path())
+    try:
+        t = json.loads(path.read_text())[_tokens_key(base_url, pub)]
+        return t['access'], t['refresh']
+    except (OSError, ValueError, KeyError, TypeError): return None
+
+def save_tokens(base_url: str, # API url the tokens were issued by
+                pub: str, # public key
+                atok: str, # access token
+                rtok: str, # refresh token
+                path = None): # cache file, defaults to `tokens.json` in the config dir
+    "Cache the tokens of `pub` on `base_url` in a file only readable by the user"
+    path = Path(path or _tokens_path())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try: toks = json.loads(path.read_text())
+    except (OSError, ValueError): toks = {}
+    toks[_tokens_key(base_url, pub)] = {'access': atok, 'refresh': rtok}
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.{threading.get_ident()}')
+    with open(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as f: json.dump(toks, f)
+    os.chmod(tmp, 0o600)
+    os.replace(tmp, path)
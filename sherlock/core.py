@@ -3,75 +3,123 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_core.ipynb.
 
 # %% auto #0
-__all__ = ['API_URL', 'me_endpoint', 'get_offers_endpoint', 'get_x402_offers_endpoint', 'Sherlock', 'Contact', 'main']
+__all__ = ['API_URL', 'me_endpoint', 'search_endpoint', 'contact_endpoint', 'get_offers_endpoint', 'get_x402_offers_endpoint',
+           'domains_endpoint', 'Sherlock', 'InvalidQuery', 'normalize_query', 'SearchCache', 'Contact', 'main']
 
-# %% ../nbs/00_core.ipynb #47039d1e
+# %% ../nbs/00_core.ipynb #f6795eb7
 import os
 from typing import Dict, Any
-import httpx, json, time
-import fastcore.utils as fc
-from fastcore.test import *
-from fastcore.script import *
-from fastcore.utils import first, last, L, patch
-from fastcore.all import asdict
-from cryptography.hazmat.primitives.asymmetric import ed25519
-
-
-from .auth import authenticate, link_account_to_email
-from .config import get_cfg, save_cfg
+import httpx, idna, json, re, threading, time, uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+import fastcore.basics as fc
+from fastcore.basics import first, last, patch
+from fastcore.foundation import L
+
+from .auth import SherlockAuth, link_account_to_email
+from .cache import TTLCache, SearchIds, ReadCache
+from .config import get_cfg, save_cfg, _tokens_path
 from .crypto import from_pk_hex, generate_keys, priv_key_hex
+from .transport import mk_client
 
 
-# %% ../nbs/00_core.ipynb #5b05a737
+# %% ../nbs/00_core.ipynb #61aa0953
 API_URL = os.getenv('SHERLOCK_API_URL', "https://api.sherlockdomains.com")
 
-# %% ../nbs/00_core.ipynb #e97f2176
+# %% ../nbs/00_core.ipynb #10947bfa
 def _handle_response(r):
     "Process response: raise for status and return json if possible. 402 status is expected for payment required."
     if r.status_code != 402: r.raise_for_status()
     try: return r.json()
     except: return r
 
-# %% ../nbs/00_core.ipynb #f3506f5e
+# %% ../nbs/00_core.ipynb #fe042be5
+def _load_keys(priv: str = ''): # private key
+    "Load the key pair from `priv`, `SHERLOCK_PRIVATE_KEY` or the config file, generating and storing a new one if none is set"
+    priv = priv or os.getenv('SHERLOCK_PRIVATE_KEY') # if not provided use the private key from the environment
+    if priv: return from_pk_hex(priv)
+    cfg = get_cfg()
+    if cfg.priv: return from_pk_hex(cfg.priv) # otherwise use the private key from the config file
+    pk, pub = generate_keys()
+    save_cfg({'priv': priv_key_hex(pk)})
+    return pk, pub
+
+# %% ../nbs/00_core.ipynb #3378affc
 class Sherlock:
     "Sherlock client class to interact with the Sherlock API."
     def __init__(self,
-                priv : str = ''): # private key
+                priv : str = '', # private key
+                client: httpx.Client = None, # http client shared by all requests, defaults to `mk_client()`
+                cache: bool = True, # cache the tokens on disk so the next instances skip the login
+                search_cache: 'SearchCache' = None, # cache of the search results, off by default
+                history: 'SearchHistory' = None, # local store recording every search, off by default
+                read_cache: ReadCache = None, # cache of the domain list and DNS records, off by default
+                prefetch: bool = False): # prefetch the purchase offers of the first domain found by each search
         """
         Initialize Sherlock with a private key. If no key is provided, a new one is generated and stored in the config file.
         """
-        cfg = get_cfg()
-
-        if priv: self.pk, self.pub = from_pk_hex(priv) # if provided use the private key
-        elif cfg.priv: self.pk, self.pub = from_pk_hex(cfg.priv) # if not provided use the private key from the config file
-        else: 
-            self.pk, self.pub = generate_keys()
-            save_cfg({'priv': priv_key_hex(self.pk)})
+        self.pk, self.pub = _load_keys(priv)
+        self.search_cache, self.history, self.read_cache = search_cache, history, read_cache
+        self.sids = SearchIds() # search id of the domains found, reused by the purchases
+        self.contact_ttl, self._contact_cache = 300., None # seconds the contact information is cached, and the cache
+        self.prefetch, self.prefetch_ttl, self.prefetch_stats = prefetch, 60., Counter() # speculative purchase offers
+        self._prefetched, self._prefetcher, self._revalidator = None, None, None
+
+        # pooled http client, only closed by us if we created it
+        self._own_client = client is None
+        self.client = client or mk_client()
+
+        # access & refresh tokens, obtained on the first authenticated request and renewed automatically
+        self.auth = SherlockAuth(self.pk, API_URL, self.client, cache=_tokens_path() if cache else None)
+
+    @property
+    def atok(self):
+        "Access token, authenticating first if needed"
+        return self.auth.token()
+    @property
+    def rtok(self):
+        "Refresh token, authenticating first if needed"
+        self.auth.token()
+        return self.auth.rtok
 
-        # access & refresh token for authenticated requests
-        self.atok, self.rtok = self._authenticate()
-        
     def _authenticate(self):
         "Authenticate with the server"
-        return authenticate(self.pk, API_URL)
+        self.auth.login()
+        return self.atok, self.rtok
+
+    def close(self):
+        "Close the http client, releasing its pooled connections"
+        self.auth.cancel()
+        if self._prefetched is not None: _discard_prefetch(self)
+        if self._prefetcher is not None: self._prefetcher.shutdown()
+        if self._revalidator is not None: self._revalidator.shutdown()
+        if self._own_client: self.client.close()
+
+    def __enter__(self): return self
+    def __exit__(self, *args): self.close()
     
     def __str__(self): return f"Sherlock(pubkey={self.pub})"
     __repr__ = __str__
 
-# %% ../nbs/00_core.ipynb #6c4e15ba
+# %% ../nbs/00_core.ipynb #c59b8c63
 me_endpoint = f"{API_URL}/api/v0/auth/me"
 
-# %% ../nbs/00_core.ipynb #83b83705
-def _mk_headers(tok): return {"Authorization": f"Bearer {tok}"}
+# %% ../nbs/00_core.ipynb #df62eb25
+def _mk_headers(tok=None, idempotency_key=None):
+    "Authorization headers if `tok` is given, with an `Idempotency-Key` making the request safe to retry if given"
+    h = {"Authorization": f"Bearer {tok}"} if tok else {}
+    if idempotency_key: h["Idempotency-Key"] = idempotency_key
+    return h
 
-# %% ../nbs/00_core.ipynb #e8715d62
+# %% ../nbs/00_core.ipynb #a9d9a42b
 @patch
 def me(self: Sherlock):
     "Get authenticated user information"
-    r = httpx.get(me_endpoint, headers=_mk_headers(self.atok))
+    r = self.client.get(me_endpoint, auth=self.auth)
     return _handle_response(r)
 
-# %% ../nbs/00_core.ipynb #8cf21345
+# %% ../nbs/00_core.ipynb #138b58df
 @patch
 def _me(self: Sherlock):
     """
@@ -80,13 +128,13 @@ def _me(self: Sherlock):
     """
     return self.me()
 
-# %% ../nbs/00_core.ipynb #70514f43
+# %% ../nbs/00_core.ipynb #7f0c25d1
 @patch
 def claim_account(self: Sherlock, email: str):
     "Claim an account by linking an email address"
-    return link_account_to_email(email, self.atok)
+    return link_account_to_email(email, self.auth.token(), API_URL, self.client)
 
-# %% ../nbs/00_core.ipynb #9b78d73e
+# %% ../nbs/00_core.ipynb #01a8c6da
 @patch
 def _claim_account(self: Sherlock, email: str):
     """
@@ -101,15 +149,75 @@ def _claim_account(self: Sherlock, email: str):
 
 
 
-# %% ../nbs/00_core.ipynb #29f701fa
+# %% ../nbs/00_core.ipynb #629ae705
+search_endpoint = f"{API_URL}/api/v0/domains/search"
+
+# %% ../nbs/00_core.ipynb #3b992e17
+class InvalidQuery(ValueError):
+    "A search query that can't be a domain name"
+    def __init__(self, query, reason, suggestion=None):
+        super().__init__(f"Invalid query {query!r}: {reason}" + (f", try {suggestion!r}" if suggestion else ''))
+        self.query, self.reason, self.suggestion = query, reason, suggestion
+
+    def asdict(self): return {'error': 'invalid_query', 'query': self.query, 'reason': self.reason, 'suggestion': self.suggestion}
+
+_label_re = re.compile(r'[a-z0-9](?:[a-z0-9-]*[a-z0-9])?')
+
+def _label(l: str, q: str):
+    "Label `l` of the query `q` in punycode, checking its characters and length"
+    if not l.isascii():
+        try: l = idna.encode(l, uts46=True).decode()
+        except UnicodeError: raise InvalidQuery(q, f"{l!r} is not a valid internationalized name") from None
+    if not _label_re.fullmatch(l): raise InvalidQuery(q, f"{l!r} can only contain letters, digits and hyphens, and can't start or end with a hyphen")
+    if len(l) > 63: raise InvalidQuery(q, f"{l[:10]!r}... is longer than 63 characters")
+    return l
+
+def normalize_query(q: str): # search query
+    "Normalized search query `q`: trimmed, lowercased and in punycode. Raises `InvalidQuery` if it can't be a domain"
+    if not isinstance(q, str): raise InvalidQuery(q, "the query must be a string")
+    n = q.strip().lower().rstrip('.')
+    if not n: raise InvalidQuery(q, "the query is empty")
+    if '/' in n or ':' in n:
+        host = n.split('://')[-1].split('/')[0].split(':')[0]
+        raise InvalidQuery(q, "URLs are not allowed, only domain names", host or None)
+    if any(c.isspace() for c in n): raise InvalidQuery(q, "spaces are not allowed", '-'.join(n.split()))
+    ls = [_label(l, q) for l in n.split('.')] if '..' not in n else None
+    if ls is None: raise InvalidQuery(q, "empty label between dots")
+    if len(ls) > 1 and ls[-1].isdigit(): raise InvalidQuery(q, "the TLD can't be numeric")
+    if len(ls) >= 3 and ls[0] == 'www': raise InvalidQuery(q, "subdomains are not allowed", '.'.join(ls[1:]))
+    return '.'.join(ls)
+
+def _query_key(q):
+    "Key shared by equivalent queries: the normalized query, or `q` itself if it is invalid"
+    try: return normalize_query(q)
+    except InvalidQuery: return q
+
+# %% ../nbs/00_core.ipynb #f7f8ccd3
 @patch
 def search(self: Sherlock,
-                  q: str): # query
+                  q: str, # query
+                  fresh: bool = False, # skip the search cache, e.g. to get a new search id for a purchase
+                  prefetch: bool = True, # prefetch the offers of the first domain found, if the client prefetches
+                  max_age: float = None): # answer from the history if `q` was searched less than `max_age` seconds ago
     "Search for domains with a query. Returns prices in USD cents."
-    r = httpx.get(f"{API_URL}/api/v0/domains/search", params={"query": q})
-    return _handle_response(r)
-
-# %% ../nbs/00_core.ipynb #2f1cb1bb
+    q = normalize_query(q)
+    c = self.search_cache
+    if c is not None and not fresh:
+        res = c.lookup(q)
+        if res is not None: return res
+    if self.history is not None and max_age is not None and not fresh:
+        res = self.history.lookup(q, max_age)
+        if res is not None: return res
+    r = self.client.get(search_endpoint, params={"query": q})
+    res = _handle_response(r)
+    if c is not None: c.store(q, r, res)
+    if isinstance(res, dict):
+        self.sids.add(res)
+        if self.history is not None: self.history.record(q, res)
+        if self.prefetch and prefetch: self._prefetch_offers(q, res)
+    return res
+
+# %% ../nbs/00_core.ipynb #38d2e89c
 @patch
 def _search(self: Sherlock,
                   q: str):
@@ -127,11 +235,99 @@ def _search(self: Sherlock,
         - "www.example.com"  # no subdomains
         - "this is a search" # no spaces
         - "sub.domain.com"   # no subdomains
+
+    Queries with spaces, URLs, invalid characters or a leading www are rejected without searching, returning the reason and a suggested query when there is one.
     """
+    try: return self.search(q)
+    except InvalidQuery as e: return e.asdict()
 
-    return self.search(q)
+# %% ../nbs/00_core.ipynb #7677f0b0
+class SearchCache(TTLCache):
+    "`TTLCache` of search results by normalized query, keeping the ones without available domains longer"
+    def __init__(self,
+                 ttl: float = 60., # seconds results with available domains are kept
+                 unavailable_ttl: float = 600., # seconds results without available domains are kept
+                 maxsize: int = 1024, # max results
+                 maxbytes: int = 16*2**20): # max total size of the results
+        super().__init__(maxsize, maxbytes)
+        self.ttl, self.unavailable_ttl = ttl, unavailable_ttl
+
+    def lookup(self, q: str):
+        "Cached search result of `q`, None if there is none"
+        raw = self.get(_query_key(q))
+        return None if raw is None else json.loads(raw) # a new copy, callers can modify it
+
+    def store(self, q: str, r: httpx.Response, res):
+        "Cache the search result `res` of `q`, received in `r`"
+        if not isinstance(res, dict): return
+        self.set(_query_key(q), r.content, self.ttl if res.get('available') else self.unavailable_ttl)
+
+# %% ../nbs/00_core.ipynb #928c40e8
+def _unique(xs, key=None):
+    "Items of `xs` without duplicates according to `key`, in order"
+    seen = set()
+    for x in xs:
+        k = x if key is None else key(x)
+        if k not in seen:
+            seen.add(k)
+            yield x
+
+def _search_result(q, res=None, err=None):
+    "Result of a bulk search for `q`: the search response, or the error it raised"
+    if err is None and not isinstance(res, dict): err = ValueError(f"The search of {q!r} didn't return a JSON object: {res!r}")
+    return {'query': q, **res, 'error': None} if err is None else {'query': q, 'error': err}
+
+# %% ../nbs/00_core.ipynb #6272100d
+@patch
+def search_many(self: Sherlock,
+                queries, # queries to search, equivalent queries are only searched once
+                concurrency: int = 8, # max searches in flight
+                max_age: float = None): # answer from the history the queries searched less than `max_age` seconds ago
+    "Search for many queries concurrently, yielding each result as it completes"
+    qs = _unique(queries, _query_key)
+    with ThreadPoolExecutor(concurrency, thread_name_prefix='sherlock-search') as ex:
+        futs = {ex.submit(self.search, q, prefetch=False, max_age=max_age): q for q in islice(qs, concurrency)}
+        try:
+            while futs:
+                done, _ = wait(futs, return_when=FIRST_COMPLETED)
+                for f in done:
+                    q = futs.pop(f)
+                    e = f.exception()
+                    yield _search_result(q, None if e else f.result(), e)
+                    for q in islice(qs, 1): futs[ex.submit(self.search, q, prefetch=False, max_age=max_age)] = q
+        finally:
+            for f in futs: f.cancel() # stopped early, don't run the searches left
+
+# %% ../nbs/00_core.ipynb #826a59b5
+def _matches(r, max_price=None, tlds=None, pred=None):
+    "Available domains of the bulk search result `r` matching the conditions, with their search id and query"
+    if r['error']: return []
+    ts = None if tlds is None else {t.lstrip('.').lower() for t in tlds}
+    # offers without a price can't be checked against `max_price`, so they are skipped like in `PriceTable`
+    return [dict(o, sid=r['id'], query=r['query']) for o in r.get('available') or ()
+            if (max_price is None or o.get('price') is not None and o['price'] <= max_price)
+            and (ts is None or o.get('tld') in ts) and (pred is None or pred(o))]
 
-# %% ../nbs/00_core.ipynb #01b7e91e
+@patch
+def find_domains(self: Sherlock,
+                 candidates, # names to search, e.g. a generator of ideas
+                 k: int = 1, # number of domains to find
+                 max_price: int = None, # highest price, in USD cents
+                 tlds: list = None, # acceptable TLDs, any if None
+                 pred = None, # extra condition on each available domain (a search entry)
+                 concurrency: int = 8): # max searches in flight
+    "Search `candidates` concurrently, yielding the available domains matching the conditions until `k` are found"
+    if k <= 0: return
+    rs = self.search_many(candidates, concurrency)
+    try:
+        for r in rs:
+            for o in _matches(r, max_price, tlds, pred):
+                yield o
+                k -= 1
+                if k == 0: return
+    finally: rs.close()
+
+# %% ../nbs/00_core.ipynb #d5a4a17d
 class Contact(fc.BasicRepr):
     "Contact information for a domain purchase"
     first_name: str
@@ -148,12 +344,35 @@ class Contact(fc.BasicRepr):
     def from_dict(d): return Contact(**d) if d else None
 
 
-# %% ../nbs/00_core.ipynb #45ab5702
+# %% ../nbs/00_core.ipynb #bf28a7dc
+contact_endpoint = f"{API_URL}/api/v0/users/contact-information"
+
+# %% ../nbs/00_core.ipynb #e054eba2
 @patch
 def is_valid(self: Contact):
     "Check if the contact information is valid"
     return all(self.__dict__.values())
 
+def _valid_contact(c: Contact): # contact information
+    "Return `c` if it is a valid contact, raise otherwise"
+    if not c or not c.is_valid(): raise ValueError("Contact information is required")
+    return c
+
+def _contact_payload(cfn, cln, cem, cadd, cct, cst, cpc, ccn):
+    "Make the contact information payload"
+    c = Contact(cfn, cln, cem, cadd, cct, cst, cpc, ccn)
+    if not c.is_valid(): raise ValueError("Invalid contact information")
+    return c.asdict()
+
+def _store_contact(s, d):
+    "Cache the contact information `d` on the client `s` for `s.contact_ttl` seconds, if it is complete"
+    s._contact_cache = (time.monotonic() + s.contact_ttl, dict(d)) if isinstance(d, dict) and d and all(d.values()) else None
+
+def _cached_contact(s):
+    "Contact information cached on the client `s`, None if there is none or it expired"
+    c = s._contact_cache
+    return dict(c[1]) if c is not None and c[0] > time.monotonic() else None
+
 @patch
 def set_contact_information(self: Sherlock,
                       cfn: str = '', # contact first name
@@ -165,33 +384,26 @@ def set_contact_information(self: Sherlock,
                       cpc: str = '', # contact postal code
                       ccn: str = ''): # contact country
     "Set the contact information for the Sherlock user"
-    c = Contact(cfn, cln, cem, cadd, cct, cst, cpc, ccn)
-    if not c.is_valid(): raise ValueError("Invalid contact information")
-
-    data = {
-        "first_name": cfn,
-        "last_name": cln,
-        "email": cem,
-        "address": cadd,
-        "city": cct,
-        "state": cst,
-        "postal_code": cpc,
-        "country": ccn
-    }
-    r = httpx.post(f"{API_URL}/api/v0/users/contact-information", json=data, headers=_mk_headers(self.atok))
-    return _handle_response(r)
+    data = _contact_payload(cfn, cln, cem, cadd, cct, cst, cpc, ccn)
+    r = self.client.post(contact_endpoint, json=data, auth=self.auth)
+    res = _handle_response(r)
+    _store_contact(self, data)
+    return res
 
 
 @patch
-def get_contact_information(self: Sherlock):
+def get_contact_information(self: Sherlock,
+                            fresh: bool = False): # skip the cached contact information
     "Get the contact information for the Sherlock user."
-
-    #| hide
-    r = httpx.get(f"{API_URL}/api/v0/users/contact-information", headers=_mk_headers(self.atok))
-    return _handle_response(r)
+    c = None if fresh else _cached_contact(self)
+    if c is not None: return c
+    r = self.client.get(contact_endpoint, auth=self.auth)
+    res = _handle_response(r)
+    _store_contact(self, res)
+    return res
    
 
-# %% ../nbs/00_core.ipynb #7ee67f06
+# %% ../nbs/00_core.ipynb #2b5c3272
 @patch
 def _set_contact_information(self: Sherlock,
                       first_name: str = '',
@@ -227,28 +439,41 @@ def _get_contact_information(self: Sherlock):
     return self.get_contact_information()
 
 
-# %% ../nbs/00_core.ipynb #30964e16
+# %% ../nbs/00_core.ipynb #e265c5df
 get_offers_endpoint = f"{API_URL}/api/v0/domains/purchase"
 
-# %% ../nbs/00_core.ipynb #f1d2f941
+# %% ../nbs/00_core.ipynb #81bf423d
 get_x402_offers_endpoint = f"{API_URL}/api/v0/domains/purchase-x402"
 
-# %% ../nbs/00_core.ipynb #6d055e4b
+# %% ../nbs/00_core.ipynb #0f8cf00a
 def _get_offers_payload(domain: str, # domain
                    contact: Contact, # contact
                    sid: str): # search id
     "Make a purchase payload"
-    return {"domain": domain, "contact_information": contact.asdict(), "search_id": sid}
+    return {"domain": domain, "contact_information": _valid_contact(contact).asdict(), "search_id": sid}
 
-# %% ../nbs/00_core.ipynb #679e96f4
+# %% ../nbs/00_core.ipynb #d088dd80
+@patch
+def _sid(self: Sherlock,
+         sid: str, # search id, empty to find one for `domain`
+         domain: str): # domain
+    "`sid`, or the tracked search id of `domain`, searching it again if there is none"
+    if sid: return sid
+    return self.sids.sid(normalize_query(domain)) or self.search(domain, fresh=True, prefetch=False)['id']
+
+# %% ../nbs/00_core.ipynb #a8e00833
 @patch
 def get_purchase_offers(self: Sherlock,
-                      sid: str, # search id
+                      sid: str, # search id, empty to reuse the last one of `domain` or search it again
                       domain: str, # domain
-                      c: Contact): # contact information
+                      c: Contact, # contact information
+                      idempotency_key: str = None): # unique key that makes the request safe to retry
     "Request available payment options for a domain."
-    if not c or not c.is_valid(): raise ValueError("Contact information is required")
-    r = httpx.post(get_offers_endpoint, json=_get_offers_payload(domain, c, sid), headers=_mk_headers(self.atok))
+    sid = self._sid(sid, domain)
+    offers = self._prefetched_offers(sid, domain, c)
+    if offers is not None: return offers
+    r = self.client.post(get_offers_endpoint, json=_get_offers_payload(domain, c, sid), auth=self.auth,
+                         headers=_mk_headers(idempotency_key=idempotency_key))
     return _handle_response(r)
 
 
@@ -259,7 +484,8 @@ def _get_purchase_offers(self: Sherlock,
     """Request available payment options for a domain.
 
     This method retrieves the L402 offers available for purchasing a specified domain. 
-    It requires a valid search ID and domain name. This method requires the contact information to be set.
+    It requires a search ID and domain name: an empty search ID reuses the last search of the domain, or searches it again.
+    This method requires the contact information to be set.
 
     The response includes:
     - `version`: The version of the L402 protocol being used.
@@ -274,31 +500,38 @@ def _get_purchase_offers(self: Sherlock,
         - `currency`: The currency of the transaction, typically 'USD'.
         - `payment_methods`: Supported payment methods, such as 'credit_card' and 'lightning'.
 """
-    contact = Contact(**self.get_contact_information())
-    if not contact or not contact.is_valid(): raise ValueError("Contact information is required")
+    contact = _valid_contact(Contact(**self.get_contact_information()))
     return self.get_purchase_offers(sid, domain, contact)
 
 
 
 
-# %% ../nbs/00_core.ipynb #0d704ab2
+# %% ../nbs/00_core.ipynb #c3b09083
+def _payment_payload(oid: str, # offer id
+                     pm: str, # payment method
+                     pct: str): # payment context token
+    "Make a payment details payload"
+    return {"offer_id": oid, "payment_method": pm, "payment_context_token": pct}
+
+def _first_offer(offers: dict, # purchase offers response
+                 pm: str): # payment method
+    "Arguments of `get_payment_details` to pay the first offer with `pm`"
+    return offers['payment_request_url'], offers['offers'][0]['id'], pm, offers['payment_context_token']
+
+# %% ../nbs/00_core.ipynb #c6a8fda2
 @patch
 def get_payment_details(self: Sherlock,
                     prurl: str, # payment request url
                     oid: str, # offer id
                     pm: str, # payment method
-                    pct: str): # payment context token
+                    pct: str, # payment context token
+                    idempotency_key: str = None): # unique key that makes the request safe to retry
     "Get payment details for an offer."
-    data = {
-        "offer_id": oid,
-        "payment_method": pm,
-        "payment_context_token": pct
-    }
-    r = httpx.post(prurl, json=data)
+    r = self.client.post(prurl, json=_payment_payload(oid, pm, pct), headers=_mk_headers(idempotency_key=idempotency_key))
     return _handle_response(r)
 
 
-# %% ../nbs/00_core.ipynb #42cfc012
+# %% ../nbs/00_core.ipynb #7cc9224f
 @patch
 def request_payment_details(self: Sherlock,
                     sid: str, # search id
@@ -307,9 +540,8 @@ def request_payment_details(self: Sherlock,
                     contact: Contact = None): # contact information
     "Request payment information for purchasing a domain. Returns the details needed to complete the payment (like a checkout URL)."
     if not contact: contact = Contact(**self.get_contact_information())
-    if not contact.is_valid(): raise ValueError("Contact information is required")
-    offers = self.get_purchase_offers(sid, domain, contact)
-    return self.get_payment_details(offers['payment_request_url'], offers['offers'][0]['id'], payment_method, offers['payment_context_token'])
+    offers = self.get_purchase_offers(sid, domain, _valid_contact(contact))
+    return self.get_payment_details(*_first_offer(offers, payment_method))
 
 
 @patch
@@ -321,29 +553,160 @@ def _request_payment_details(self: Sherlock,
     Purchase a domain. This method won't charge your account, it will return the payment information needed to complete the purchase.
     Contact information must be set before calling this method.
 
-    sid: Search ID from a previous search request
+    sid: Search ID from a previous search request, or an empty string to reuse the last search of the domain
     domain: Domain name to purchase
     payment_method: Payment method to use {'credit_card', 'lightning'}
     """
-    contact = Contact(**self.get_contact_information())
-    if not contact or not contact.is_valid(): raise ValueError("Contact information is required")
+    contact = _valid_contact(Contact(**self.get_contact_information()))
     return self.request_payment_details(sid, domain, payment_method, contact)
 
 
-# %% ../nbs/00_core.ipynb #c7b0ece2
+# %% ../nbs/00_core.ipynb #6b58eef3
+def _first_available(q, res):
+    "Domain of the search response `res` most likely to be bought: `q` itself if it is available, else the first one found"
+    av = res.get('available') or ()
+    return first(o['name'] for o in av if o['name'] == q) or first(o['name'] for o in av)
+
+def _discard_prefetch(s):
+    "Discard the prefetch of the client `s`, if there is one"
+    p, s._prefetched = s._prefetched, None
+    if p is None: return
+    if p[2].done() and not p[2].cancelled(): p[2].exception() # retrieved, so a failure isn't reported as unhandled
+    else: p[2].cancel()
+    s.prefetch_stats['discarded'] += 1
+
+def _take_prefetch(s, sid, domain):
+    "Prefetch of the offers of `domain` found by the search `sid` on the client `s`. Any other prefetch is discarded"
+    p = s._prefetched
+    if p is None: return None
+    if p[0] != (sid, domain) or time.monotonic() - p[1] > s.prefetch_ttl: return _discard_prefetch(s)
+    s._prefetched = None
+    return p[2]
+
+def _prefetch_result(s, c, res, err):
+    "Offers of a finished prefetch of the client `s`, if it succeeded for the contact `c`"
+    if err is not None or res[0] != _valid_contact(c).asdict():
+        s.prefetch_stats['failed' if err is not None else 'discarded'] += 1
+        return None
+    s.prefetch_stats['used'] += 1
+    return res[1]
+
+@patch
+def _offers_task(self: Sherlock, sid: str, domain: str):
+    "Contact information and purchase offers of `domain`, fetched in the background"
+    c = _valid_contact(Contact(**self.get_contact_information()))
+    r = self.client.post(get_offers_endpoint, json=_get_offers_payload(domain, c, sid), auth=self.auth)
+    return c.asdict(), _handle_response(r)
+
+@patch
+def _prefetch_offers(self: Sherlock, q: str, res: dict):
+    "Start fetching the purchase offers of the domain of the search response `res` most likely to be bought"
+    domain = _first_available(q, res)
+    if domain is None: return
+    _discard_prefetch(self)
+    if self._prefetcher is None: self._prefetcher = ThreadPoolExecutor(1, thread_name_prefix='sherlock-prefetch')
+    self._prefetched = (res['id'], domain), time.monotonic(), self._prefetcher.submit(self._offers_task, res['id'], domain)
+    self.prefetch_stats['started'] += 1
+
+@patch
+def _prefetched_offers(self: Sherlock, sid: str, domain: str, c: Contact):
+    "Prefetched purchase offers of `domain` for the contact `c`, None if there are none"
+    f = _take_prefetch(self, sid, domain)
+    if f is None: return None
+    try: return _prefetch_result(self, c, f.result(), None)
+    except Exception as e: return _prefetch_result(self, c, None, e)
+
+# %% ../nbs/00_core.ipynb #178b3ba3
+def _load_checkpoint(path):
+    "Batch key and steps of each domain recorded in the checkpoint file `path`"
+    batch, steps = None, {}
+    if path is None or not os.path.exists(path): return batch, steps
+    with open(path) as f:
+        for l in f:
+            try: d = json.loads(l)
+            except ValueError: continue # last line cut short by a crash
+            if 'batch' in d: batch = d['batch']
+            else: steps.setdefault(d.pop('domain'), {}).update(d)
+    return batch, steps
+
+class _Checkpoint:
+    "Steps of a bulk purchase, appended to the file `path` as soon as they succeed"
+    def __init__(self, path=None):
+        (self.batch, self.steps), self.lock = _load_checkpoint(path), threading.Lock()
+        self.f = None if path is None else open(path, 'a')
+        if self.batch is None:
+            self.batch = uuid.uuid4().hex
+            self._write(batch=self.batch)
+
+    def get(self, domain, k): return self.steps.get(domain, {}).get(k)
+
+    def key(self, domain, step):
+        "Idempotency key of `step` of `domain`, the same when the batch is resumed"
+        return str(uuid.uuid5(uuid.UUID(self.batch), f'{domain}:{step}'))
+
+    def _write(self, **kw):
+        if self.f is None: return
+        self.f.write(json.dumps(kw) + '\n')
+        self.f.flush()
+        os.fsync(self.f.fileno())
+
+    def add(self, domain, **kw):
+        with self.lock:
+            self.steps.setdefault(domain, {}).update(kw)
+            self._write(domain=domain, **kw)
+
+    def close(self):
+        if self.f is not None: self.f.close()
+    def __enter__(self): return self
+    def __exit__(self, *args): self.close()
+
+def _purchase_result(ck, domain, resumed=False, err=None):
+    "Row of a bulk purchase for `domain`: its steps recorded in `ck`, and the error that made it fail"
+    st = ck.steps.get(domain, {})
+    return {'domain': domain, 'sid': st.get('sid'), 'offers': st.get('offers'), 'payment': st.get('payment'), 'resumed': resumed, 'error': err}
+
+def _purchase_items(items):
+    "(search id, domain) pairs of a bulk purchase, with each domain normalized and only once"
+    return list(_unique(((sid, _query_key(d)) for sid, d in items), lambda o: o[1]))
+
+# %% ../nbs/00_core.ipynb #9288290c
+@patch
+def _purchase_one(self: Sherlock, sid: str, domain: str, pm: str, c: Contact, ck: _Checkpoint):
+    "Row of a bulk purchase for `domain`, skipping the steps recorded in `ck`"
+    if ck.get(domain, 'payment') is not None: return _purchase_result(ck, domain, resumed=True)
+    try:
+        if ck.get(domain, 'offers') is None:
+            sid = self._sid(sid, domain)
+            ck.add(domain, sid=sid, offers=self.get_purchase_offers(sid, domain, c, ck.key(domain, 'offers')))
+        ck.add(domain, payment=self.get_payment_details(*_first_offer(ck.get(domain, 'offers'), pm), ck.key(domain, 'payment')))
+    except Exception as e: return _purchase_result(ck, domain, err=e)
+    return _purchase_result(ck, domain)
+
+@patch
+def purchase_many(self: Sherlock,
+                  items, # (search id, domain) pairs, an empty search id reuses the last one of the domain or searches it again
+                  payment_method: str = 'credit_card', # payment method {'credit_card', 'lightning'}
+                  concurrency: int = 8, # max domains purchased at once
+                  checkpoint: str = None): # file recording the steps done, so running the batch again resumes it
+    "Request the payment details of many domains concurrently, returning a row per domain"
+    items = _purchase_items(items)
+    c = _valid_contact(Contact(**self.get_contact_information()))
+    with _Checkpoint(checkpoint) as ck, ThreadPoolExecutor(concurrency, thread_name_prefix='sherlock-purchase') as ex:
+        return list(ex.map(lambda o: self._purchase_one(*o, payment_method, c, ck), items))
+
+# %% ../nbs/00_core.ipynb #ae75eb3a
 @patch
 def get_x402_purchase_offers(self: Sherlock,
-                             sid: str,      # search id
+                             sid: str,      # search id, empty to reuse the last one of `domain` or search it again
                              domain: str,   # domain
                              c: Contact):   # contact information
     "Request X402 payment requirements for a domain purchase."
-    if not c or not c.is_valid(): raise ValueError("Contact information is required")
-    r = httpx.post(get_x402_offers_endpoint,
-                   json=_get_offers_payload(domain, c, sid),
-                   headers=_mk_headers(self.atok))
+    r = self.client.post(get_x402_offers_endpoint,
+                         json=_get_offers_payload(domain, c, self._sid(sid, domain)),
+                         auth=self.auth)
     return _handle_response(r)
 
-# %% ../nbs/00_core.ipynb #38605ab9
+# %% ../nbs/00_core.ipynb #82a42963
 @patch
 def _get_x402_purchase_offers(self: Sherlock,
                               sid: str,      # search id
@@ -364,27 +727,30 @@ def _get_x402_purchase_offers(self: Sherlock,
         - `amount`: Payment amount.
     - `resource`: The resource being purchased.
     """
-    contact = Contact(**self.get_contact_information())
-    if not contact or not contact.is_valid(): raise ValueError("Contact information is required")
+    contact = _valid_contact(Contact(**self.get_contact_information()))
     return self.get_x402_purchase_offers(sid, domain, contact)
 
-# %% ../nbs/00_core.ipynb #5aa15999
+# %% ../nbs/00_core.ipynb #6595a4bd
+def _x402_headers(payment_signature: str, # PAYMENT-SIGNATURE header value
+                  idempotency_key: str = None): # makes the request safe to retry
+    "Headers carrying the X402 payment signature"
+    return {**_mk_headers(idempotency_key=idempotency_key), "PAYMENT-SIGNATURE": payment_signature}
+
+# %% ../nbs/00_core.ipynb #c5399872
 @patch
 def purchase_x402(self: Sherlock,
-                  sid: str,               # search id
+                  sid: str,               # search id, empty to reuse the last one of `domain` or search it again
                   domain: str,            # domain
                   payment_signature: str, # PAYMENT-SIGNATURE header value
-                  c: Contact):            # contact information
+                  c: Contact,             # contact information
+                  idempotency_key: str = None): # unique key that makes the request safe to retry
     "Complete an X402 domain purchase with a payment signature."
-    if not c or not c.is_valid(): raise ValueError("Contact information is required")
-    headers = _mk_headers(self.atok)
-    headers["PAYMENT-SIGNATURE"] = payment_signature
-    r = httpx.post(get_x402_offers_endpoint,
-                   json=_get_offers_payload(domain, c, sid),
-                   headers=headers)
+    r = self.client.post(get_x402_offers_endpoint,
+                         json=_get_offers_payload(domain, c, self._sid(sid, domain)),
+                         auth=self.auth, headers=_x402_headers(payment_signature, idempotency_key))
     return _handle_response(r)
 
-# %% ../nbs/00_core.ipynb #1559ad4e
+# %% ../nbs/00_core.ipynb #622c22ef
 @patch
 def _purchase_x402(self: Sherlock,
                    sid: str,               # search id
@@ -396,7 +762,7 @@ def _purchase_x402(self: Sherlock,
     completing the purchase. The caller is responsible for producing the signature
     (e.g., using the x402 Python library or receiving it from another party).
 
-    sid: Search ID from a previous search request
+    sid: Search ID from a previous search request, or an empty string to reuse the last search of the domain
     domain: Domain name to purchase
     payment_signature: The PAYMENT-SIGNATURE header value for X402 payment authorization
 
@@ -405,22 +771,145 @@ def _purchase_x402(self: Sherlock,
     - `domain`: The purchased domain name.
     - `state`: The purchase state.
     """
-    contact = Contact(**self.get_contact_information())
-    if not contact or not contact.is_valid(): raise ValueError("Contact information is required")
+    contact = _valid_contact(Contact(**self.get_contact_information()))
     return self.purchase_x402(sid, domain, payment_signature, contact)
 
-# %% ../nbs/00_core.ipynb #ba509af9
+# %% ../nbs/00_core.ipynb #12239c1b
+domains_endpoint = f"{API_URL}/api/v0/domains/domains"
+
+def _nameservers_endpoint(domain_id): return f"{API_URL}/api/v0/domains/{domain_id}/nameservers"
+def _dns_endpoint(domain_id, record_id=None):
+    url = f"{API_URL}/api/v0/domains/{domain_id}/dns/records"
+    return f"{url}/{record_id}" if record_id else url
+
+def _dns_payload(type, name, value, ttl, record_id=None):
+    "Make a DNS records payload, `record_id` is only set for updates"
+    rec = {"type":type, "name":name, "value":value, "ttl":ttl}
+    return {"records": [{"id":record_id, **rec} if record_id else rec]}
+
+# %% ../nbs/00_core.ipynb #30e4238e
+def _cached_response(c, k, r, version):
+    "Decoded response `r` to the GET of the key `k`, kept in the read cache `c`. None if it is a 304 and nothing is cached anymore"
+    if r.status_code == 304: return c.revalidated(k)
+    res = _handle_response(r)
+    if r.status_code == 200 and isinstance(res, (dict, list)): c.store(k, r, version)
+    return res
+
+def _read_key(s, url):
+    "Read cache key of `url` for the client `s`: responses are per account, so a cache can be shared by several"
+    return s.pub, url
+
+def _invalidate(s, *urls):
+    "Drop the responses of `urls` from the read cache of the client `s`, if it has one"
+    if s.read_cache is not None: s.read_cache.invalidate(*(_read_key(s, u) for u in urls))
+
 @patch
-def domains(self:Sherlock):
-    "List of domains owned by the authenticated user"
-    r = httpx.get(f"{API_URL}/api/v0/domains/domains", headers=_mk_headers(self.atok))
-    return _handle_response(r)
+def _revalidate(self: Sherlock, url: str):
+    "GET `url`, conditionally if its response is cached, updating the read cache"
+    c, k = self.read_cache, _read_key(self, url)
+    v = c.version(k)
+    try: r = self.client.get(url, auth=self.auth, headers=c.headers(k))
+    finally: c.refreshed(k)
+    res = _cached_response(c, k, r, v)
+    return self._revalidate(url) if res is None else res
 
-# %% ../nbs/00_core.ipynb #4d166b63
 @patch
-def _domains(self:Sherlock):
+def _read(self: Sherlock,
+          url: str, # url to GET
+          fresh: bool = False): # revalidate the cached response before returning it
+    "GET `url` through the read cache, serving a stale response while it is revalidated in the background"
+    c = self.read_cache
+    if c is None: return _handle_response(self.client.get(url, auth=self.auth))
+    if not fresh:
+        res, stale = c.lookup(_read_key(self, url))
+        if res is not None:
+            if stale and c.refresh(_read_key(self, url)):
+                if self._revalidator is None: self._revalidator = ThreadPoolExecutor(1, thread_name_prefix='sherlock-revalidate')
+                self._revalidator.submit(self._revalidate, url)
+            return res
+    return self._revalidate(url)
+
+# %% ../nbs/00_core.ipynb #798fe3f2
+@patch
+def domains(self:Sherlock,
+            fresh: bool = False): # revalidate the cached domain list, if the client has a read cache
+    "List of domains owned by the authenticated user"
+    return self._read(domains_endpoint, fresh)
+
+# %% ../nbs/00_core.ipynb #dc8820be
+_item_sep, _decoder = re.compile(r'[\s,]*'), json.JSONDecoder()
+
+class _JSONItems:
+    "Incremental parser of a JSON array, returning its items as its text arrives"
+    def __init__(self): self.buf, self.started, self.done = '', False, False
+
+    def feed(self,
+             text: str, # next chunk of the text
+             final: bool = False): # whether it is the last one
+        "Items of the array completed by `text`"
+        buf, pos, items = self.buf + text, 0, []
+        while not self.done:
+            pos = _item_sep.match(buf, pos).end()
+            if pos == len(buf): break
+            if not self.started:
+                if buf[pos] != '[': raise ValueError("Expected a JSON array")
+                self.started, pos = True, pos + 1
+                continue
+            if buf[pos] == ']':
+                self.done = True
+                break
+            try: o, end = _decoder.raw_decode(buf, pos)
+            except ValueError:
+                if final: raise
+                break # the item goes on in the next chunk
+            if end == len(buf) and not final: break # a number could go on too
+            items.append(o)
+            pos = end
+        self.buf = buf[pos:]
+        if final and not self.done: raise ValueError("Incomplete JSON array")
+        return items
+
+def _cursor(cursor):
+    "Index of the first domain of the page at `cursor`, a `next_cursor` or empty for the first page"
+    c = str(cursor or 0)
+    if not (c.isascii() and c.isdigit()):
+        raise ValueError(f"Invalid cursor {cursor!r}: pass the `next_cursor` of the previous page, or an empty cursor for the first page")
+    return int(c)
+
+def _limit(limit):
+    "Number of domains of a page, at least one so that `next_cursor` always moves forward"
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        raise ValueError(f"Invalid limit {limit!r}: pass the number of domains of the page, at least 1")
+    return limit
+
+def _page(start, ds, limit):
+    "Page of `limit` domains taken from `ds`, the domains from `start` on, with the cursor of the next page"
+    items = list(islice(ds, limit + 1))
+    return {'domains': items[:limit], 'next_cursor': str(start + limit) if len(items) > limit else None}
+
+# %% ../nbs/00_core.ipynb #af023772
+@patch
+def iter_domains(self: Sherlock,
+                 chunk_size: int = 2**16): # characters of the response parsed at a time
+    "Domains owned by the authenticated user, yielded one at a time while the list downloads"
+    p = _JSONItems()
+    with self.client.stream('GET', domains_endpoint, auth=self.auth) as r:
+        r.raise_for_status()
+        for t in r.iter_text(chunk_size): yield from p.feed(t)
+        yield from p.feed('', final=True)
+
+# %% ../nbs/00_core.ipynb #01b0d2a1
+@patch
+def _domains(self:Sherlock,
+             cursor: str = '',
+             limit: int = 50):
     """
-    List domains owned by the authenticated user.
+    List domains owned by the authenticated user, a page at a time.
+
+    cursor: `next_cursor` of the previous page, empty for the first page
+    limit: Max number of domains in the page
+
+    Returns `domains`, the domains of the page, and `next_cursor`, the cursor of the next page (null on the last page).
     
     Each domain object contains:
         id (str): Unique domain identifier (domain_id in other methods)
@@ -433,19 +922,74 @@ def _domains(self:Sherlock):
         nameservers (list): List of nameserver hostnames
         status (str): Domain status (e.g. 'active')
     """
-    return self.domains()
-
+    start, limit = _cursor(cursor), _limit(limit)
+    if self.read_cache is not None: return _page(start, self.domains()[start:], limit)
+    ds = self.iter_domains()
+    try: return _page(start, islice(ds, start, None), limit)
+    finally: ds.close()
+
+
+# %% ../nbs/00_core.ipynb #ab113aa9
+class _DomainWaiter:
+    "Poll cycle shared by the domains waited for, with an exponential backoff"
+    def __init__(self, domains, timeout, status, interval, max_interval):
+        self.pending, self.states = set(map(_query_key, domains)), {}
+        self.deadline, self.status = time.monotonic() + timeout, status
+        self.interval, self.max_interval, self.delay = interval, max_interval, interval
+
+    def update(self, ds): # domain list
+        "Pending domains of `ds` that reached the status, adapting the delay of the next poll"
+        ds = {d['domain_name']: d for d in ds if d['domain_name'] in self.pending}
+        states = {**self.states, **{k: d.get('status') for k, d in ds.items()}}
+        self.delay = self.interval if states != self.states else min(self.delay * 2, self.max_interval)
+        self.states = states
+        done = [d for d in ds.values() if d.get('status') == self.status]
+        self.pending -= {d['domain_name'] for d in done}
+        return done
+
+    def wait(self):
+        "Seconds until the next poll, raising `TimeoutError` once the deadline has passed"
+        left = self.deadline - time.monotonic()
+        if left <= 0: raise TimeoutError(f"Domains not {self.status} after the timeout: {', '.join(sorted(self.pending))}")
+        return min(self.delay, left)
+
+# %% ../nbs/00_core.ipynb #b2e7dfc5
+@patch
+def wait_for_domains(self: Sherlock,
+                     domains, # domain names, e.g. the ones just purchased
+                     timeout: float = 600, # seconds to wait before raising `TimeoutError`
+                     status: str = 'active', # status to wait for
+                     interval: float = 2, # first delay between polls, in seconds
+                     max_interval: float = 60): # longest delay between polls, in seconds
+    "Poll the domain list until each of `domains` has `status`, yielding each domain as soon as it does"
+    w = _DomainWaiter(domains, timeout, status, interval, max_interval)
+    while w.pending:
+        yield from w.update(self.domains(fresh=True))
+        if w.pending: time.sleep(w.wait())
 
-# %% ../nbs/00_core.ipynb #bab0ec3a
+@patch
+def wait_for_domain(self: Sherlock,
+                    domain: str, # domain name
+                    timeout: float = 600, # seconds to wait before raising `TimeoutError`
+                    status: str = 'active', # status to wait for
+                    interval: float = 2, # first delay between polls, in seconds
+                    max_interval: float = 60): # longest delay between polls, in seconds
+    "Wait until `domain` has `status`, returning it"
+    return first(self.wait_for_domains([domain], timeout, status, interval, max_interval))
+
+# %% ../nbs/00_core.ipynb #eb965836
 @patch
 def update_nameservers(self:Sherlock,
                        domain_id: str, # domain id
-                       nameservers: list[str]): # nameservers
+                       nameservers: list[str], # nameservers
+                       idempotency_key: str = None): # unique key that makes the request safe to retry
     "Update the nameserver list for a domain"
-    r = httpx.patch(f"{API_URL}/api/v0/domains/{domain_id}/nameservers", json={"nameservers": nameservers}, headers=_mk_headers(self.atok))
+    try: r = self.client.patch(_nameservers_endpoint(domain_id), json={"nameservers": nameservers}, auth=self.auth,
+                               headers=_mk_headers(idempotency_key=idempotency_key))
+    finally: _invalidate(self, domains_endpoint, _dns_endpoint(domain_id))
     return _handle_response(r)
 
-# %% ../nbs/00_core.ipynb #253a7ae0
+# %% ../nbs/00_core.ipynb #0839d870
 @patch
 def _update_nameservers(self:Sherlock,
                 domain_id: str,
@@ -460,16 +1004,15 @@ def _update_nameservers(self:Sherlock,
     """
     return self.update_nameservers(domain_id, nameservers)
 
-# %% ../nbs/00_core.ipynb #c2931c6f
+# %% ../nbs/00_core.ipynb #ef3c93bb
 @patch
 def dns_records(self:Sherlock,
-                domain_id: str): # domain id
+                domain_id: str, # domain id
+                fresh: bool = False): # revalidate the cached records, if the client has a read cache
     "Get DNS records for a domain."
-    r = httpx.get(f"{API_URL}/api/v0/domains/{domain_id}/dns/records", 
-                 headers=_mk_headers(self.atok))
-    return _handle_response(r)
+    return self._read(_dns_endpoint(domain_id), fresh)
 
-# %% ../nbs/00_core.ipynb #bf0cfb67
+# %% ../nbs/00_core.ipynb #c994d66e
 @patch
 def _dns_records(self:Sherlock,
                 domain_id: str):
@@ -487,21 +1030,22 @@ def _dns_records(self:Sherlock,
     """
     return self.dns_records(domain_id)
 
-# %% ../nbs/00_core.ipynb #673aff53
+# %% ../nbs/00_core.ipynb #d8006916
 @patch
 def create_dns(self:Sherlock,
                domain_id: str, # domain id
                type: str = "TXT", # type
                name: str = "test", # name
                value: str = "test-1", # value
-               ttl: int = 3600): # ttl
+               ttl: int = 3600, # ttl
+               idempotency_key: str = None): # unique key that makes the request safe to retry
     "Create a new DNS record"
-    data = {"records": [{"type":type, "name":name, "value":value, "ttl":ttl}]}
-    r = httpx.post(f"{API_URL}/api/v0/domains/{domain_id}/dns/records",
-                  headers=_mk_headers(self.atok), json=data)
+    try: r = self.client.post(_dns_endpoint(domain_id), auth=self.auth, headers=_mk_headers(idempotency_key=idempotency_key),
+                              json=_dns_payload(type, name, value, ttl))
+    finally: _invalidate(self, _dns_endpoint(domain_id))
     return _handle_response(r)
 
-# %% ../nbs/00_core.ipynb #1d3daf3e
+# %% ../nbs/00_core.ipynb #6725daa9
 @patch
 def _create_dns_record(self:Sherlock,
                 domain_id: str, # domain id
@@ -521,7 +1065,7 @@ def _create_dns_record(self:Sherlock,
     return self.create_dns(domain_id, type, name, value, ttl)
 
 
-# %% ../nbs/00_core.ipynb #7434a3f3
+# %% ../nbs/00_core.ipynb #0f52bb61
 @patch
 def update_dns(self:Sherlock,
                domain_id: str, # domain id
@@ -529,15 +1073,15 @@ def update_dns(self:Sherlock,
                type: str = "TXT", # type
                name: str = "test-2", # name
                value: str = "test-2", # value
-               ttl: int = 3600): # ttl
+               ttl: int = 3600, # ttl
+               idempotency_key: str = None): # unique key that makes the request safe to retry
     "Update a DNS record"
-    data = {"records": [{"id":record_id, "type":type, "name":name, 
-                        "value":value, "ttl":ttl}]}
-    r = httpx.patch(f"{API_URL}/api/v0/domains/{domain_id}/dns/records",
-                   headers=_mk_headers(self.atok), json=data)
+    try: r = self.client.patch(_dns_endpoint(domain_id), auth=self.auth, headers=_mk_headers(idempotency_key=idempotency_key),
+                               json=_dns_payload(type, name, value, ttl, record_id))
+    finally: _invalidate(self, _dns_endpoint(domain_id))
     return _handle_response(r)
 
-# %% ../nbs/00_core.ipynb #58530c9e
+# %% ../nbs/00_core.ipynb #b11b54e7
 @patch
 def _update_dns_record(self:Sherlock,
                 domain_id: str, # domain id
@@ -561,17 +1105,17 @@ def _update_dns_record(self:Sherlock,
     return self.update_dns(domain_id, record_id, type, name, value, ttl)
 
 
-# %% ../nbs/00_core.ipynb #8e37ec11
+# %% ../nbs/00_core.ipynb #43095772
 @patch
 def delete_dns(self:Sherlock,
                domain_id: str, # domain id
                record_id: str): # record id
     "Delete a DNS record"
-    r = httpx.delete(f"{API_URL}/api/v0/domains/{domain_id}/dns/records/{record_id}",
-                    headers=_mk_headers(self.atok))
+    try: r = self.client.delete(_dns_endpoint(domain_id, record_id), auth=self.auth)
+    finally: _invalidate(self, _dns_endpoint(domain_id))
     return _handle_response(r)
 
-# %% ../nbs/00_core.ipynb #30881439
+# %% ../nbs/00_core.ipynb #ae33b5e9
 @patch
 def _delete_dns_record(self:Sherlock,
                 domain_id: str, # domain id
@@ -585,7 +1129,7 @@ def _delete_dns_record(self:Sherlock,
     return self.delete_dns(domain_id, record_id)
 
 
-# %% ../nbs/00_core.ipynb #dbd9d091
+# %% ../nbs/00_core.ipynb #da6e4a70
 @patch
 def as_tools(self:Sherlock):
     "Return the Sherlock class as a list of tools ready for agents to use"
@@ -605,11 +1149,7 @@ def as_tools(self:Sherlock):
         self._delete_dns_record,
     ])
 
-# %% ../nbs/00_core.ipynb #42d75195
-from inspect import signature, Parameter
-import argparse
-
-# %% ../nbs/00_core.ipynb #9208ac74
+# %% ../nbs/00_core.ipynb #9eeaff4e
 @patch
 def as_cli(self:Sherlock):
     "Return the Sherlock class as a list of tools ready for agents to use"
@@ -629,21 +1169,28 @@ def as_cli(self:Sherlock):
         self.delete_dns,
     ])
 
-# %% ../nbs/00_core.ipynb #3d3b4435
-def main():
-    "CLI interface for Sherlock"
+# %% ../nbs/00_core.ipynb #1224fa7d
+def _cli_parser():
+    "Parser of the CLI, with a subcommand per method of `Sherlock.as_cli`"
+    import argparse # only needed by the CLI, kept out of `import sherlock.core`
+    from inspect import signature
     parser = argparse.ArgumentParser()
     sub = parser.add_subparsers(dest='cmd')
-    s = Sherlock()
-    
-    for m in s.as_cli():
+    # commands are read from the class, so `--help` needs neither keys nor a client
+    for m in Sherlock.as_cli(Sherlock):
         p = sub.add_parser(m.__name__, help=m.__doc__)
         for name,param in signature(m).parameters.items():
             if name != 'self': 
                 required = param.default == param.empty
-                p.add_argument(f'--{name}', required=required)
-    
+                # booleans are `--fresh`, `--fresh true` or `--fresh false`, so "False" isn't passed on as a truthy string
+                if param.annotation is bool: p.add_argument(f'--{name}', required=required, type=fc.str2bool, nargs='?', const=True)
+                else: p.add_argument(f'--{name}', required=required)
+    return parser
+
+def main():
+    "CLI interface for Sherlock"
+    parser = _cli_parser()
     args = parser.parse_args()
-    if args.cmd: print(getattr(s,args.cmd)(**{k:v for k,v in vars(args).items() 
-                                             if k!='cmd' and v is not None}))
-    else: parser.print_help()
+    if not args.cmd: return parser.print_help()
+    with Sherlock() as s: print(getattr(s,args.cmd)(**{k:v for k,v in vars(args).items()
+                                                     if k!='cmd' and v is not None}))
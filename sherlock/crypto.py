@@ -5,19 +5,17 @@
 # %% auto #0
 __all__ = ['generate_keys', 'from_pk_hex', 'priv_key_hex']
 
-# %% ../nbs/01_crypto.ipynb #dffd2cc1
-from cryptography.hazmat.primitives.asymmetric import ed25519
-import secrets; secrets.token_hex(32)
-
-# %% ../nbs/01_crypto.ipynb #8128d49e
+# %% ../nbs/01_crypto.ipynb #d6a41091
 def generate_keys():
+    from cryptography.hazmat.primitives.asymmetric import ed25519
     pk = ed25519.Ed25519PrivateKey.generate()
     pub = pk.public_key().public_bytes_raw().hex()
     return pk, pub
 
 
-# %% ../nbs/01_crypto.ipynb #eccbd593
+# %% ../nbs/01_crypto.ipynb #e6146c91
 def from_pk_hex(priv):
+    from cryptography.hazmat.primitives.asymmetric import ed25519
     pk = ed25519.Ed25519PrivateKey.from_private_bytes(bytes.fromhex(priv))
     return pk, pk.public_key().public_bytes_raw().hex()
 
@@ -0,0 +1,107 @@
+"""Local history of the prices and availability seen by searches."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/10_history.ipynb.
+
+# %% auto #0
+__all__ = ['SearchHistory']
+
+# %% ../nbs/10_history.ipynb #19e0140a
+import sqlite3, threading, time
+from datetime import datetime, timezone
+from itertools import chain
+from pathlib import Path
+from fastcore.basics import first, patch
+
+from .config import _cfg_path
+
+# %% ../nbs/10_history.ipynb #c9cc8003
+_schema = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+CREATE TABLE IF NOT EXISTS searches (sid TEXT PRIMARY KEY, query TEXT NOT NULL, ts REAL NOT NULL);
+CREATE TABLE IF NOT EXISTS domains (sid TEXT NOT NULL, name TEXT NOT NULL, tld TEXT NOT NULL, price INTEGER, currency TEXT,
+                                    available INTEGER NOT NULL, ts REAL NOT NULL);
+CREATE INDEX IF NOT EXISTS searches_query ON searches (query, ts);
+CREATE INDEX IF NOT EXISTS domains_name ON domains (name, ts);
+CREATE INDEX IF NOT EXISTS domains_tld ON domains (tld, ts);
+CREATE INDEX IF NOT EXISTS domains_sid ON domains (sid);
+"""
+_cols = 'name, tld, price, currency, available, sid, ts'
+
+def _history_path(): return _cfg_path().parent / 'history.db'
+
+def _row(r): return dict(name=r[0], tld=r[1], price=r[2], currency=r[3], available=bool(r[4]), sid=r[5], ts=r[6])
+
+class SearchHistory:
+    "SQLite store of the searches made, with the price and availability of the domains they returned"
+    def __init__(self, path = None): # database file, defaults to `history.db` in the config dir, ':memory:' for a temporary one
+        path = str(path or _history_path())
+        if path != ':memory:': Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.db.executescript(_schema)
+
+    def _all(self, sql, args=()):
+        with self.lock: return self.db.execute(sql, args).fetchall()
+
+    def close(self): self.db.close()
+    def __len__(self): return self._all("SELECT count(*) FROM domains")[0][0]
+    def __repr__(self): return f"{type(self).__name__}({len(self)} domains)"
+
+# %% ../nbs/10_history.ipynb #7424ab63
+def _domain_rows(results, ts, searches):
+    "Rows of the domains of `results`, collecting a row per search in `searches`"
+    for q, r in results:
+        searches.append((r['id'], q, ts))
+        for o in chain(r['available'] or (), r['unavailable'] or ()):
+            yield r['id'], o['name'], o.get('tld') or o['name'].rpartition('.')[2], o.get('price'), o.get('currency'), int(bool(o.get('available'))), ts
+
+@patch
+def record_many(self: SearchHistory,
+                results, # (query, search response) pairs
+                ts: float = None): # time of the searches, defaults to now
+    "Record many searches in one transaction"
+    ts, searches = time.time() if ts is None else ts, []
+    with self.lock, self.db:
+        self.db.executemany("INSERT INTO domains VALUES (?, ?, ?, ?, ?, ?, ?)", _domain_rows(results, ts, searches))
+        self.db.executemany("INSERT OR REPLACE INTO searches VALUES (?, ?, ?)", searches)
+
+@patch
+def record(self: SearchHistory,
+           q: str, # normalized query
+           res: dict, # search response
+           ts: float = None): # time of the search, defaults to now
+    "Record the search of `q`"
+    self.record_many([(q, res)], ts)
+
+# %% ../nbs/10_history.ipynb #e568d9fb
+@patch
+def last_seen(self: SearchHistory, name: str): # domain name, e.g. "trakwiska.com"
+    "Latest record of the domain `name`: its price, availability, search id and time. None if it was never seen"
+    return first(map(_row, self._all(f"SELECT {_cols} FROM domains WHERE name = ? ORDER BY ts DESC LIMIT 1", (name,))))
+
+@patch
+def history(self: SearchHistory,
+            name: str, # domain name
+            since: float = 0): # only the records made since this time
+    "Records of the domain `name`, from the oldest"
+    return [_row(r) for r in self._all(f"SELECT {_cols} FROM domains WHERE name = ? AND ts >= ? ORDER BY ts", (name, since))]
+
+@patch
+def tld(self: SearchHistory,
+        tld: str, # TLD, e.g. "com"
+        since: float = 0): # only the records made since this time
+    "Records of the domains of `tld`, from the oldest"
+    return [_row(r) for r in self._all(f"SELECT {_cols} FROM domains WHERE tld = ? AND ts >= ? ORDER BY ts", (tld.lstrip('.').lower(), since))]
+
+@patch
+def lookup(self: SearchHistory,
+           q: str, # normalized query
+           max_age: float): # seconds after which a search is too old
+    "Latest search of `q` made less than `max_age` seconds ago, rebuilt as a search response. None if there is none"
+    s = first(self._all("SELECT sid, ts FROM searches WHERE query = ? AND ts >= ? ORDER BY ts DESC LIMIT 1", (q, time.time() - max_age)))
+    if s is None: return None
+    ds = [_row(r) for r in self._all(f"SELECT {_cols} FROM domains WHERE sid = ?", (s[0],))]
+    es = [{k: d[k] for k in ('name', 'tld', 'price', 'currency', 'available')} for d in ds]
+    return {'id': s[0], 'created_at': datetime.fromtimestamp(s[1], timezone.utc).isoformat(),
+            'available': [e for e in es if e['available']], 'unavailable': [e for e in es if not e['available']]}
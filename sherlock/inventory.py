@@ -0,0 +1,94 @@
+"""Local, indexed copy of the domains held by an account."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/11_inventory.ipynb.
+
+# %% auto #0
+__all__ = ['DomainInventory']
+
+# %% ../nbs/11_inventory.ipynb #6c204b9c
+import bisect, time
+from collections import Counter
+from datetime import datetime
+from fastcore.basics import patch
+
+# %% ../nbs/11_inventory.ipynb #2ec3e30b
+def _ts(s):
+    "Timestamp of the ISO date `s`, None if there is none"
+    return None if not s else datetime.fromisoformat(s.replace('Z', '+00:00')).timestamp()
+
+def _ns(n): return n.lower().rstrip('.')
+def _nss(d): return set(map(_ns, d.get('nameservers') or ())) # the same nameserver can be listed twice, e.g. with and without its final dot
+
+class DomainInventory:
+    "Local copy of the domains of an account, indexed by name, id, expiry date and nameserver"
+    def __init__(self, domains=()): # domain list, as returned by `Sherlock.domains`
+        self.ids, self.names, self.expiry, self.ns = {}, {}, [], {} # id -> domain, name -> id, sorted (expiry, id), nameserver -> ids
+        self.sync(domains)
+
+    def _add(self, d):
+        i = d['id']
+        self.ids[i] = d
+        self.names[_ns(d['domain_name'])] = i
+        t = _ts(d.get('expires_at'))
+        if t is not None: bisect.insort(self.expiry, (t, i))
+        for n in _nss(d): self.ns.setdefault(n, set()).add(i)
+
+    def _drop(self, i):
+        d = self.ids.pop(i)
+        self.names.pop(_ns(d['domain_name']), None)
+        t = _ts(d.get('expires_at'))
+        if t is not None: del self.expiry[bisect.bisect_left(self.expiry, (t, i))]
+        for n in _nss(d):
+            ids = self.ns[n]
+            ids.discard(i)
+            if not ids: del self.ns[n]
+
+    def sync(self, domains): # domain list, as returned by `Sherlock.domains`
+        "Reindex the domains added, changed or removed in `domains`, returning how many there were"
+        new, n = {d['id']: d for d in domains}, Counter()
+        for i in [i for i in self.ids if i not in new]:
+            self._drop(i)
+            n['removed'] += 1
+        for i, d in new.items():
+            old = self.ids.get(i)
+            if old == d: continue
+            if old is not None: self._drop(i)
+            self._add(d)
+            n['added' if old is None else 'updated'] += 1
+        return {k: n[k] for k in ('added', 'updated', 'removed')}
+
+    def __len__(self): return len(self.ids)
+    def __iter__(self): return iter(self.ids.values())
+    def __contains__(self, name): return _ns(name) in self.names
+    def __repr__(self): return f"{type(self).__name__}({len(self)} domains)"
+
+# %% ../nbs/11_inventory.ipynb #b43cf5b8
+@patch
+def get(self: DomainInventory, name: str): # domain name, e.g. "h402.org"
+    "Domain named `name`, None if the account doesn't hold it"
+    i = self.names.get(_ns(name))
+    return None if i is None else self.ids[i]
+
+@patch
+def id_of(self: DomainInventory, name: str): # domain name
+    "Id of the domain named `name`, the `domain_id` of the DNS methods. None if the account doesn't hold it"
+    return self.names.get(_ns(name))
+
+@patch
+def expiring(self: DomainInventory,
+             days: float = 30, # number of days ahead
+             now: float = None): # current time, defaults to now
+    "Domains expiring in the next `days` days, from the first to expire"
+    now = time.time() if now is None else now
+    lo, hi = bisect.bisect_left(self.expiry, (now,)), bisect.bisect_left(self.expiry, (now + days*86400,))
+    return [self.ids[i] for _, i in self.expiry[lo:hi]]
+
+@patch
+def expired(self: DomainInventory, now: float = None): # current time, defaults to now
+    "Domains already expired, from the first to expire"
+    return [self.ids[i] for _, i in self.expiry[:bisect.bisect_left(self.expiry, (time.time() if now is None else now,))]]
+
+@patch
+def using(self: DomainInventory, nameserver: str): # nameserver, e.g. "paislee.ns.cloudflare.com"
+    "Domains using `nameserver`, by name"
+    return sorted((self.ids[i] for i in self.ns.get(_ns(nameserver), ())), key=lambda d: d['domain_name'])
@@ -0,0 +1,59 @@
+"""MCP server exposing the Sherlock agent tools."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/06_mcp.ipynb.
+
+# %% auto #0
+__all__ = ['mk_mcp', 'main']
+
+# %% ../nbs/06_mcp.ipynb #e266e494
+import asyncio, sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial, wraps
+
+from .core import Sherlock
+from .aio import AsyncSherlock
+
+# %% ../nbs/06_mcp.ipynb #941c172e
+class _Workers:
+    "Thread pool running blocking tools, alive while at least one server run is using it"
+    def __init__(self, max_workers: int = 8): self.max_workers, self.pool, self.runs = max_workers, None, 0
+
+    @asynccontextmanager
+    async def lifespan(self, server):
+        "Server lifespan shutting the pool down when the last run stops"
+        self.runs += 1
+        try: yield
+        finally:
+            self.runs -= 1
+            if not self.runs and self.pool is not None: self.pool, pool = None, self.pool; pool.shutdown(wait=False)
+
+    def threaded(self, f):
+        "Async wrapper running the blocking tool `f` in the pool"
+        @wraps(f)
+        async def _f(*args, **kwargs):
+            if self.pool is None: self.pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix='sherlock-mcp')
+            return await asyncio.get_running_loop().run_in_executor(self.pool, partial(f, *args, **kwargs))
+        return _f
+
+# %% ../nbs/06_mcp.ipynb #d4398922
+def mk_mcp(s = None, # `AsyncSherlock` or `Sherlock` instance, defaults to `AsyncSherlock()`
+           max_workers: int = 8, # worker threads used for a sync `Sherlock`
+           name: str = "Sherlock Domains MCP Server"): # server name
+    "Create a FastMCP server serving the tools of `s`"
+    try: from fastmcp import FastMCP
+    except ImportError: raise ImportError("The MCP server requires fastmcp, install it with `pip install sherlock-domains[mcp]`") from None
+    s = s or AsyncSherlock()
+    if isinstance(s, AsyncSherlock): mcp, tools = FastMCP(name), s.as_tools()
+    else:
+        w = _Workers(max_workers)
+        mcp, tools = FastMCP(name, lifespan=w.lifespan), s.as_tools().map(w.threaded)
+    for t in tools: mcp.tool(t)
+    return mcp
+
+# %% ../nbs/06_mcp.ipynb #909f6c93
+def main():
+    "Run the Sherlock MCP server over stdio"
+    try: mcp = mk_mcp()
+    except ImportError as e: sys.exit(str(e))
+    mcp.run()
@@ -0,0 +1,90 @@
+"""Compact typed models of the Sherlock API responses."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/08_models.ipynb.
+
+# %% auto #0
+__all__ = ['Model', 'DomainOffer', 'SearchResult', 'PurchaseOffer', 'PurchaseOffers', 'Domain', 'DnsRecord', 'DnsRecords']
+
+# %% ../nbs/08_models.ipynb #918c9bbf
+def _asdict(v):
+    if isinstance(v, Model): return v.asdict()
+    if isinstance(v, tuple): return [_asdict(o) for o in v]
+    return v
+
+class Model:
+    "Base of the response models: a `__slots__` class with one field per key of the payload"
+    __slots__ = ()
+    _fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(s.lstrip('_') for s in cls.__slots__)
+
+    def __init__(self, d: dict = None, **kw): # decoded JSON payload, and fields given as keywords
+        "Model of the decoded JSON payload `d`"
+        if kw: d = {**(d or {}), **kw}
+        get = (d or {}).get
+        for s, k in zip(self.__slots__, self._fields): setattr(self, s, get(k))
+
+    @classmethod
+    def from_list(cls, ds): return list(map(cls, ds))
+
+    def __getitem__(self, k):
+        if k not in self._fields: raise KeyError(k)
+        return getattr(self, k)
+
+    def get(self, k, default=None): return getattr(self, k) if k in self._fields else default
+
+    def asdict(self):
+        "The model as a JSON payload"
+        return {k: _asdict(getattr(self, k)) for k in self._fields}
+
+    def __eq__(self, o): return type(self) is type(o) and self.asdict() == o.asdict()
+    __hash__ = None # compared by value but mutable, like the dicts they replace
+    def __repr__(self): return f"{type(self).__name__}({', '.join(f'{k}={getattr(self, k)!r}' for k in self._fields)})"
+
+class _Lazy:
+    "Field holding a list of `cls` models, parsed from the payload on first access"
+    def __init__(self, cls): self.cls = cls
+    def __set_name__(self, owner, name): self.slot = owner.__dict__['_' + name]
+
+    def __get__(self, o, owner=None):
+        if o is None: return self
+        v = self.slot.__get__(o)
+        if isinstance(v, list): # still the decoded payload
+            v = tuple(map(self.cls, v))
+            self.slot.__set__(o, v)
+        return v
+
+# %% ../nbs/08_models.ipynb #8787f4cf
+class DomainOffer(Model):
+    "A domain found by a search, with its yearly price in USD cents"
+    __slots__ = ('name', 'tld', 'tags', 'price', 'currency', 'available')
+
+class SearchResult(Model):
+    "Result of `Sherlock.search`"
+    __slots__ = ('id', 'created_at', '_available', '_unavailable')
+    available, unavailable = _Lazy(DomainOffer), _Lazy(DomainOffer)
+
+# %% ../nbs/08_models.ipynb #cf70dd1d
+class PurchaseOffer(Model):
+    "One of the ways of paying for a domain"
+    __slots__ = ('id', 'title', 'description', 'type', 'amount', 'currency', 'payment_methods')
+
+class PurchaseOffers(Model):
+    "Result of `Sherlock.get_purchase_offers`"
+    __slots__ = ('version', 'payment_request_url', 'payment_context_token', '_offers')
+    offers = _Lazy(PurchaseOffer)
+
+class Domain(Model):
+    "A domain owned by the user, as listed by `Sherlock.domains`"
+    __slots__ = ('id', 'domain_name', 'created_at', 'expires_at', 'auto_renew', 'locked', 'private', 'nameservers', 'status')
+
+class DnsRecord(Model):
+    "A DNS record of a domain"
+    __slots__ = ('id', 'type', 'name', 'value', 'ttl')
+
+class DnsRecords(Model):
+    "Result of `Sherlock.dns_records`"
+    __slots__ = ('domain', '_records')
+    records = _Lazy(DnsRecord)
@@ -0,0 +1,114 @@
+"""Columnar analysis of the prices and TLDs found by searches."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/09_prices.ipynb.
+
+# %% auto #0
+__all__ = ['PriceTable']
+
+# %% ../nbs/09_prices.ipynb #df5da850
+import heapq
+from array import array
+from itertools import chain
+from fastcore.basics import patch, store_attr
+
+try: import numpy as np
+except ImportError: np = None
+
+# %% ../nbs/09_prices.ipynb #f949bba3
+_cols = ('name', 'tld', 'price', 'available', 'result')
+_types = dict(tld='i', price='d', available='b', result='i') # `array.array` typecodes, used without NumPy
+
+def _col(k, xs):
+    "Column `k` from the list `xs`, a NumPy array or, without NumPy, an `array.array`"
+    if k == 'name': return xs if np is None else np.array(xs, dtype=object)
+    if np is not None: return np.array(xs, dtype=bool if k == 'available' else np.float64 if k == 'price' else np.int32)
+    return array(_types[k], xs)
+
+def _list(c): return c if isinstance(c, list) else c.tolist()
+
+class PriceTable:
+    "Columnar table of the domains found by one or many searches"
+    def __init__(self, name, tld, price, available, result, # columns
+                 tlds: list, # TLD of each code in `tld`
+                 sids: list): # search id of each index in `result`
+        store_attr()
+
+    @classmethod
+    def from_results(cls, results): # search responses, as dicts or `SearchResult`s
+        "Table of the entries of `results`"
+        cols, codes, sids = {k: [] for k in _cols}, {}, []
+        for i, r in enumerate(results):
+            sids.append(r['id'])
+            for o in chain(r['available'] or (), r['unavailable'] or ()):
+                if o.get('price') is None: continue
+                cols['name'].append(o['name'])
+                cols['tld'].append(codes.setdefault(o['tld'], len(codes)))
+                cols['price'].append(o['price'])
+                cols['available'].append(bool(o['available']))
+                cols['result'].append(i)
+        return cls(*(_col(k, cols[k]) for k in _cols), list(codes), sids)
+
+    def __len__(self): return len(self.price)
+    def __repr__(self): return f"{type(self).__name__}({len(self)} domains, {len(self.tlds)} TLDs, {len(self.sids)} searches)"
+
+    def rows(self):
+        "The entries of the table as dicts, with the TLD name and search id"
+        ts, rs = _list(self.tld), _list(self.result)
+        return [dict(name=n, tld=self.tlds[t], price=p, available=a, sid=self.sids[r])
+                for n, t, p, a, r in zip(_list(self.name), ts, _list(self.price), _list(self.available), rs)]
+
+    def _take(self, idx):
+        "Table of the rows at the indexes `idx`"
+        if np is not None: cols = [getattr(self, k)[idx] for k in _cols]
+        else: cols = [_col(k, [getattr(self, k)[i] for i in idx]) for k in _cols]
+        return type(self)(*cols, self.tlds, self.sids)
+
+# %% ../nbs/09_prices.ipynb #5ba5dc5f
+def _codes(t: PriceTable, tlds):
+    ts = {o.lstrip('.').lower() for o in tlds}
+    return [i for i, o in enumerate(t.tlds) if o in ts]
+
+@patch
+def where(self: PriceTable,
+          max_price: int = None, # keep the domains up to this price, in USD cents
+          tlds: list = None, # keep the domains with one of these TLDs
+          available: bool = True): # keep the available domains, or the unavailable ones if False, or both if None
+    "Table of the domains matching all the conditions"
+    if np is not None:
+        m = np.ones(len(self), dtype=bool)
+        if available is not None: m &= self.available == available
+        if max_price is not None: m &= self.price <= max_price
+        if tlds is not None: m &= np.isin(self.tld, _codes(self, tlds))
+        return self._take(np.flatnonzero(m))
+    codes = None if tlds is None else set(_codes(self, tlds))
+    return self._take([i for i, (a, p, t) in enumerate(zip(self.available, self.price, self.tld))
+                       if (available is None or a == available) and (max_price is None or p <= max_price) and (codes is None or t in codes)])
+
+@patch
+def cheapest(self: PriceTable, k: int = 10): # number of domains
+    "Table of the `k` cheapest domains, by increasing price"
+    n, p, k = len(self), self.price, max(k, 0)
+    if np is None: return self._take(heapq.nsmallest(k, range(n), key=p.__getitem__))
+    if k >= n: return self._take(np.argsort(p, kind='stable'))
+    idx = np.argpartition(p, k)[:k]
+    return self._take(idx[np.argsort(p[idx], kind='stable')])
+
+# %% ../nbs/09_prices.ipynb #23c662d7
+@patch
+def by_tld(self: PriceTable):
+    "Number of domains, lowest and mean price of each TLD, by increasing lowest price"
+    nt = len(self.tlds)
+    if np is not None:
+        count = np.bincount(self.tld, minlength=nt)
+        total = np.bincount(self.tld, weights=self.price, minlength=nt)
+        low = np.full(nt, np.inf)
+        np.minimum.at(low, self.tld, self.price)
+        count, total, low = count.tolist(), total.tolist(), low.tolist()
+    else:
+        count, total, low = [0]*nt, [0]*nt, [None]*nt
+        for t, p in zip(self.tld, self.price):
+            count[t] += 1
+            total[t] += p
+            if low[t] is None or p < low[t]: low[t] = p
+    stats = sorted((low[i], t, count[i], total[i]/count[i]) for i, t in enumerate(self.tlds) if count[i])
+    return {t: dict(count=c, min=l, mean=round(m, 1)) for l, t, c, m in stats}
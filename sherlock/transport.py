@@ -0,0 +1,341 @@
+"""Pooled HTTP transport shared by every Sherlock request."""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/04_transport.ipynb.
+
+# %% auto #0
+__all__ = ['default_limits', 'RetryBudget', 'RetryPolicy', 'RetryTransport', 'AsyncRetryTransport', 'TokenBucket',
+           'FileTokenBucket', 'RateLimiter', 'RateLimitTransport', 'AsyncRateLimitTransport', 'mk_client',
+           'retry_stats', 'mk_async_client']
+
+# %% ../nbs/04_transport.ipynb #d010e186
+import httpx
+import random, re, threading, time
+from functools import lru_cache
+from collections import Counter, deque
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from fastcore.basics import first, store_attr
+
+try: import fcntl
+except ImportError: fcntl = None # not available on Windows
+
+# %% ../nbs/04_transport.ipynb #33e7cc5e
+class RetryBudget:
+    "Allow at most `min_retries` plus `ratio` of the requests sent in the last `window` seconds as retries"
+    def __init__(self,
+                 ratio: float = 0.2, # retries allowed per request
+                 min_retries: int = 10, # retries always allowed per window
+                 window: float = 10.): # seconds of traffic considered
+        store_attr()
+        self.reqs, self.retries, self.lock = deque(), deque(), threading.Lock()
+
+    def _prune(self, now):
+        for q in (self.reqs, self.retries):
+            while q and q[0] < now - self.window: q.popleft()
+
+    def request(self):
+        "Record a new request"
+        with self.lock: self.reqs.append(time.monotonic())
+
+    def withdraw(self):
+        "Take a retry from the budget, returns False if it is exhausted"
+        with self.lock:
+            now = time.monotonic()
+            self._prune(now)
+            if len(self.retries) >= self.min_retries + self.ratio * len(self.reqs): return False
+            self.retries.append(now)
+            return True
+
+# %% ../nbs/04_transport.ipynb #aad3e4eb
+_id_re = re.compile(r'/[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}(?=/|$)')
+def _endpoint(request: httpx.Request): return f"{request.method} {_id_re.sub('/{id}', request.url.path)}"
+
+_safe_methods = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+def _idempotent(request: httpx.Request): return request.method in _safe_methods or 'Idempotency-Key' in request.headers
+
+# failures that happen before the request reaches the server, always safe to retry
+_unsent = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+_retry_excs = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+def _unprocessed(response: httpx.Response):
+    "Whether the server turned the request away without processing it, always safe to retry"
+    return response.status_code == 429 or response.status_code == 503 and 'Retry-After' in response.headers
+
+def _retry_after(response: httpx.Response):
+    "Seconds to wait from the `Retry-After` header, if any"
+    v = response.headers.get('Retry-After')
+    if v is None: return None
+    try: return max(0., float(v))
+    except ValueError: pass
+    try: return max(0., parsedate_to_datetime(v).timestamp() - time.time())
+    except (TypeError, ValueError): return None
+
+# %% ../nbs/04_transport.ipynb #eb1af22d
+class RetryPolicy:
+    "When to retry a failed request and how long to wait before doing it"
+    def __init__(self,
+                 retries: int = 3, # max retries per request
+                 backoff: float = 0.5, # base delay in seconds, doubled on every attempt
+                 max_backoff: float = 30., # max delay between attempts
+                 max_retry_after: float = 60., # give up if the server asks to wait longer than this
+                 jitter: bool = True, # randomize the delays
+                 statuses: tuple = (429, 500, 502, 503, 504), # retryable status codes
+                 budget: RetryBudget = None): # retry budget, defaults to `RetryBudget()`
+        store_attr(but='budget')
+        self.budget = budget or RetryBudget()
+        self.stats, self.denied = Counter(), Counter() # retries made and retries refused by the budget, per endpoint
+
+    def delay(self,
+              request: httpx.Request, # request that failed
+              attempt: int, # retries already made for `request`
+              response: httpx.Response = None, # response received, if any
+              exc: Exception = None): # transport error raised, if any
+        "Seconds to wait before retrying `request`, or None if it should not be retried"
+        if attempt >= self.retries: return None
+        if exc is not None:
+            if not isinstance(exc, _retry_excs) or not (isinstance(exc, _unsent) or _idempotent(request)): return None
+        elif response.status_code not in self.statuses or not (_unprocessed(response) or _idempotent(request)): return None
+        ra = None if response is None else _retry_after(response)
+        if ra is not None and ra > self.max_retry_after: return None
+        ep = _endpoint(request)
+        if not self.budget.withdraw():
+            self.denied[ep] += 1
+            return None
+        self.stats[ep] += 1
+        if ra is not None: return ra
+        d = min(self.max_backoff, self.backoff * 2**attempt)
+        return random.uniform(0, d) if self.jitter else d
+
+# %% ../nbs/04_transport.ipynb #094b33cf
+class RetryTransport(httpx.BaseTransport):
+    "Transport retrying failed requests according to a `RetryPolicy`"
+    def __init__(self, transport: httpx.BaseTransport, policy: RetryPolicy = None):
+        self.transport, self.policy = transport, policy or RetryPolicy()
+
+    def handle_request(self, request):
+        self.policy.budget.request()
+        attempt = 0
+        while True:
+            response = exc = None
+            try: response = self.transport.handle_request(request)
+            except httpx.TransportError as e: exc = e
+            delay = self.policy.delay(request, attempt, response, exc)
+            if delay is None:
+                if exc is not None: raise exc
+                return response
+            if response is not None: response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self): self.transport.close()
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    "Async transport retrying failed requests according to a `RetryPolicy`"
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: RetryPolicy = None):
+        self.transport, self.policy = transport, policy or RetryPolicy()
+
+    async def handle_async_request(self, request):
+        self.policy.budget.request()
+        attempt = 0
+        while True:
+            response = exc = None
+            try: response = await self.transport.handle_async_request(request)
+            except httpx.TransportError as e: exc = e
+            delay = self.policy.delay(request, attempt, response, exc)
+            if delay is None:
+                if exc is not None: raise exc
+                return response
+            if response is not None: await response.aclose()
+            import asyncio # only loaded by async clients, it is slow to import
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self): await self.transport.aclose()
+
+# %% ../nbs/04_transport.ipynb #d56b4dd0
+class TokenBucket:
+    "Token bucket allowing `rate` requests per second with bursts of up to `burst` requests, shared by threads"
+    def __init__(self,
+                 rate: float, # tokens refilled per second
+                 burst: int = 1): # max tokens available at once
+        store_attr()
+        self.tat, self.lock = 0., threading.Lock()
+
+    def _update(self, f):
+        "Replace the arrival time with `f(tat)`, which returns the new time and a result"
+        with self.lock:
+            self.tat, res = f(self.tat)
+            return res
+
+    def acquire(self) -> float:
+        "Take a token, returns the seconds to wait before using it"
+        iv = 1/self.rate
+        def _f(tat):
+            now = time.time()
+            tat = max(tat, now) + iv
+            return tat, max(0., tat - self.burst*iv - now)
+        return self._update(_f)
+
+    def block(self, until: float):
+        "Hold back every request until the timestamp `until`"
+        iv = 1/self.rate
+        self._update(lambda tat: (max(tat, until + (self.burst-1)*iv), None))
+
+    def limit(self, remaining: int):
+        "Allow at most `remaining` requests right away"
+        iv = 1/self.rate
+        self._update(lambda tat: (max(tat, time.time() + (self.burst-remaining)*iv), None))
+
+# %% ../nbs/04_transport.ipynb #3cd6c085
+class FileTokenBucket(TokenBucket):
+    "`TokenBucket` stored in the file `path`, shared by every process using it"
+    def __init__(self,
+                 rate: float, # tokens refilled per second
+                 burst: int = 1, # max tokens available at once
+                 path: str = None): # file holding the bucket state
+        if fcntl is None: raise NotImplementedError("Shared rate limits require file locks, which are only available on POSIX systems")
+        super().__init__(rate, burst)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _update(self, f):
+        with self.lock, open(self.path, 'a+') as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX) # released when the file is closed
+            fh.seek(0)
+            try: tat = float(fh.read() or 0)
+            except ValueError: tat = 0.
+            tat, res = f(tat)
+            fh.seek(0)
+            fh.truncate()
+            fh.write(repr(tat))
+            return res
+
+# %% ../nbs/04_transport.ipynb #0dd215a8
+default_limits = dict(search=(5, 10), dns=(2, 5), auth=(1, 5), default=(10, 20))
+
+def _group(request: httpx.Request):
+    "Rate limit group of `request`"
+    p = request.url.path
+    if p.startswith('/api/v0/auth/'): return 'auth'
+    if p.startswith('/api/v0/domains/search'): return 'search'
+    if '/dns/records' in p and request.method != 'GET': return 'dns'
+    return 'default'
+
+def _header(response, *names):
+    v = first(response.headers.get(n) for n in names if n in response.headers)
+    try: return None if v is None else float(v)
+    except ValueError: return None
+
+def _ratelimit(response: httpx.Response):
+    "Requests remaining and seconds until the limit resets, from the `RateLimit-*` headers"
+    rem = _header(response, 'RateLimit-Remaining', 'X-RateLimit-Remaining')
+    reset = _header(response, 'RateLimit-Reset', 'X-RateLimit-Reset')
+    if reset is not None and reset > 1e9: reset = max(0., reset - time.time()) # epoch timestamp
+    return rem, reset
+
+# %% ../nbs/04_transport.ipynb #668fac0c
+class RateLimiter:
+    "Token buckets per endpoint group, shared with other processes through the files in `shared_dir` if given"
+    def __init__(self,
+                 limits: dict = None, # `(rate, burst)` per group, overriding `default_limits`
+                 shared_dir: str = None): # directory of the buckets shared by several processes
+        self.limits = {**default_limits, **(limits or {})}
+        def _bucket(g, rate, burst): return FileTokenBucket(rate, burst, Path(shared_dir)/f'{g}.bucket') if shared_dir else TokenBucket(rate, burst)
+        self.buckets = {g: _bucket(g, *l) for g,l in self.limits.items() if l}
+        self.waited = Counter() # seconds spent waiting, per group
+
+    def acquire(self, request: httpx.Request) -> float:
+        "Take a token for `request`, returns the seconds to wait before sending it"
+        g = _group(request)
+        if g not in self.buckets: return 0.
+        d = self.buckets[g].acquire()
+        if d: self.waited[g] += d
+        return d
+
+    def update(self, request: httpx.Request, response: httpx.Response):
+        "Adapt the bucket of `request` to the rate limit signaled by `response`"
+        b = self.buckets.get(_group(request))
+        if b is None: return
+        rem, reset = _ratelimit(response)
+        if response.status_code == 429: b.block(time.time() + first((_retry_after(response), reset, 1/b.rate), lambda o: o is not None))
+        elif rem is not None:
+            if rem < 1 and reset: b.block(time.time() + reset)
+            else: b.limit(int(rem))
+
+# %% ../nbs/04_transport.ipynb #1c4214c6
+class RateLimitTransport(httpx.BaseTransport):
+    "Transport holding back requests according to a `RateLimiter`"
+    def __init__(self, transport: httpx.BaseTransport, limiter: RateLimiter = None):
+        self.transport, self.limiter = transport, limiter or RateLimiter()
+
+    def handle_request(self, request):
+        d = self.limiter.acquire(request)
+        if d: time.sleep(d)
+        response = self.transport.handle_request(request)
+        self.limiter.update(request, response)
+        return response
+
+    def close(self): self.transport.close()
+
+class AsyncRateLimitTransport(httpx.AsyncBaseTransport):
+    "Async transport holding back requests according to a `RateLimiter`"
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter = None):
+        self.transport, self.limiter = transport, limiter or RateLimiter()
+
+    async def handle_async_request(self, request):
+        d = self.limiter.acquire(request)
+        if d:
+            import asyncio
+            await asyncio.sleep(d)
+        response = await self.transport.handle_async_request(request)
+        self.limiter.update(request, response)
+        return response
+
+    async def aclose(self): await self.transport.aclose()
+
+# %% ../nbs/04_transport.ipynb #d2baebcf
+@lru_cache(maxsize=None)
+def _ssl_context():
+    "SSL context shared by all the clients, loading the CA bundle takes ~40ms"
+    return httpx.create_ssl_context()
+
+def _limits(max_connections: int = 100, # max open connections in the pool
+            max_keepalive: int = 20, # max idle connections kept alive for reuse
+            keepalive_expiry: float = 30.): # seconds an idle connection is kept alive
+    "Connection pool limits"
+    return httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive,
+                        keepalive_expiry=keepalive_expiry)
+
+def mk_client(timeout: float = 30., # seconds before a request times out
+              max_connections: int = 100, # max open connections in the pool
+              max_keepalive: int = 20, # max idle connections kept alive for reuse
+              keepalive_expiry: float = 30., # seconds an idle connection is kept alive
+              http2: bool = False, # use HTTP/2, requires `pip install httpx[http2]`
+              retry: RetryPolicy = None, # retry policy, defaults to `RetryPolicy()`, use `RetryPolicy(retries=0)` to disable
+              rate_limit: RateLimiter = None, # client side rate limiter, off by default
+              **kwargs): # extra arguments passed to `httpx.Client`
+    "Create a pooled, keep-alive `httpx.Client` for the Sherlock API"
+    transport = kwargs.pop('transport', None) or httpx.HTTPTransport(limits=_limits(max_connections, max_keepalive, keepalive_expiry), http2=http2,
+                                                                     verify=_ssl_context())
+    if rate_limit: transport = RateLimitTransport(transport, rate_limit)
+    return httpx.Client(timeout=timeout, transport=RetryTransport(transport, retry), **kwargs)
+
+# %% ../nbs/04_transport.ipynb #f2eb9a2b
+def retry_stats(client): # client created by `mk_client` or `mk_async_client`
+    "Retries consumed by each endpoint of `client`"
+    return client._transport.policy.stats
+
+# %% ../nbs/04_transport.ipynb #d611adf1
+def mk_async_client(timeout: float = 30., # seconds before a request times out
+                    max_connections: int = 100, # max open connections in the pool
+                    max_keepalive: int = 20, # max idle connections kept alive for reuse
+                    keepalive_expiry: float = 30., # seconds an idle connection is kept alive
+                    http2: bool = False, # use HTTP/2, requires `pip install httpx[http2]`
+                    retry: RetryPolicy = None, # retry policy, defaults to `RetryPolicy()`, use `RetryPolicy(retries=0)` to disable
+                    rate_limit: RateLimiter = None, # client side rate limiter, off by default
+                    **kwargs): # extra arguments passed to `httpx.AsyncClient`
+    "Create a pooled, keep-alive `httpx.AsyncClient` for the Sherlock API"
+    transport = kwargs.pop('transport', None) or httpx.AsyncHTTPTransport(limits=_limits(max_connections, max_keepalive, keepalive_expiry), http2=http2,
+                                                                          verify=_ssl_context())
+    if rate_limit: transport = AsyncRateLimitTransport(transport, rate_limit)
+    return httpx.AsyncClient(timeout=timeout, transport=AsyncRetryTransport(transport, retry), **kwargs)